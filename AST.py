@@ -33,10 +33,15 @@ class NodeType(Enum):
 
 
 class Node(ABC):
-    @abstractmethod
+    # Every concrete node declares its NodeType once at class level
+    NODE_TYPE: NodeType
+
+    # Hot expression nodes declare __slots__; the bases stay dict-free so those take effect
+    __slots__ = ()
+
     def type(self) -> NodeType:
         """ Returns back the NodeType """
-        pass
+        return self.NODE_TYPE
 
     @abstractmethod
     def json(self) -> dict:
@@ -45,19 +50,18 @@ class Node(ABC):
 
 
 class Statement(Node):
-    pass
+    __slots__ = ()
 
 class Expression(Node):
-    pass
+    __slots__ = ()
 
 class Program(Node):
     """ The root node for the AST """
+    NODE_TYPE = NodeType.Program
+
     def __init__(self) -> None:
         self.statements: list[Statement] = []
 
-    def type(self) -> NodeType:
-        return NodeType.Program
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -66,13 +70,12 @@ class Program(Node):
     
 # region Helpers
 class FunctionParameter(Expression):
+    NODE_TYPE = NodeType.FunctionParameter
+
     def __init__(self, name: str, value_type: str = None) -> None:
         self.name = name
         self.value_type = value_type
 
-    def type(self) -> NodeType:
-        return NodeType.FunctionParameter
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -83,12 +86,11 @@ class FunctionParameter(Expression):
 
 # region Statements
 class ExpressionStatement(Statement):
+    NODE_TYPE = NodeType.ExpressionStatement
+
     def __init__(self, expr: Expression = None) -> None:
         self.expr: Expression = expr
 
-    def type(self) -> NodeType:
-        return NodeType.ExpressionStatement
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -96,14 +98,13 @@ class ExpressionStatement(Statement):
         }
     
 class LetStatement(Statement):
+    NODE_TYPE = NodeType.LetStatement
+
     def __init__(self, name: Expression = None, value: Expression = None, value_type: str = None) -> None:
         self.name = name
         self.value = value
         self.value_type = value_type
 
-    def type(self) -> NodeType:
-        return NodeType.LetStatement
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -113,12 +114,11 @@ class LetStatement(Statement):
         }
     
 class BlockStatement(Statement):
+    NODE_TYPE = NodeType.BlockStatement
+
     def __init__(self, statements: list[Statement] = None) -> None:
         self.statements = statements if statements is not None else []
 
-    def type(self) -> NodeType:
-        return NodeType.BlockStatement
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -126,12 +126,11 @@ class BlockStatement(Statement):
         }
     
 class ReturnStatement(Statement):
+    NODE_TYPE = NodeType.ReturnStatement
+
     def __init__(self, return_value: Expression = None) -> None:
         self.return_value = return_value
 
-    def type(self) -> NodeType:
-        return NodeType.ReturnStatement
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -139,15 +138,14 @@ class ReturnStatement(Statement):
         }
     
 class FunctionStatement(Statement):
+    NODE_TYPE = NodeType.FunctionStatement
+
     def __init__(self, parameters: list[FunctionParameter] = [], body: BlockStatement = None, name = None, return_type: str = None) -> None:
         self.parameters = parameters
         self.body = body
         self.name = name
         self.return_type = return_type
 
-    def type(self) -> NodeType:
-        return NodeType.FunctionStatement
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -158,13 +156,12 @@ class FunctionStatement(Statement):
         }
     
 class AssignStatement(Statement):
+    NODE_TYPE = NodeType.AssignStatement
+
     def __init__(self, ident: Expression = None, right_value: Expression = None) -> None:
         self.ident = ident
         self.right_value = right_value
 
-    def type(self) -> NodeType:
-        return NodeType.AssignStatement
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -173,14 +170,13 @@ class AssignStatement(Statement):
         }
     
 class IfStatement(Statement):
+    NODE_TYPE = NodeType.IfStatement
+
     def __init__(self, condition: Expression = None, consequence: BlockStatement = None, alternative: BlockStatement = None) -> None:
         self.condition = condition
         self.consequence = consequence
         self.alternative = alternative
 
-    def type(self) -> NodeType:
-        return NodeType.IfStatement
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -190,13 +186,12 @@ class IfStatement(Statement):
         }
     
 class WhileStatement(Statement):
+    NODE_TYPE = NodeType.WhileStatement
+
     def __init__(self, condition: Expression, body: BlockStatement = None) -> None:
         self.condition = condition
         self.body = body if body is not None else []
 
-    def type(self) -> NodeType:
-        return NodeType.WhileStatement
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -205,39 +200,36 @@ class WhileStatement(Statement):
         }
     
 class BreakStatement(Statement):
+    NODE_TYPE = NodeType.BreakStatement
+
     def __init__(self) -> None:
         pass
 
-    def type(self) -> NodeType:
-        return NodeType.BreakStatement
-    
     def json(self) -> dict:
         return {
             "type": self.type().value
         }
     
 class ContinueStatement(Statement):
+    NODE_TYPE = NodeType.ContinueStatement
+
     def __init__(self) -> None:
         pass
 
-    def type(self) -> NodeType:
-        return NodeType.ContinueStatement
-    
     def json(self) -> dict:
         return {
             "type": self.type().value
         }
     
 class ForStatement(Statement):
+    NODE_TYPE = NodeType.ForStatement
+
     def __init__(self, var_declaration: LetStatement = None, condition: Expression = None, action: AssignStatement = None, body: BlockStatement = None) -> None:
         self.var_declaration = var_declaration
         self.condition = condition
         self.action = action
         self.body = body
 
-    def type(self) -> NodeType:
-        return NodeType.ForStatement
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -250,14 +242,14 @@ class ForStatement(Statement):
     
 # region Expressions
 class InfixExpression(Expression):
+    NODE_TYPE = NodeType.InfixExpression
+    __slots__ = ('left_node', 'operator', 'right_node')
+
     def __init__(self, left_node: Expression, operator: str, right_node: Expression = None):
         self.left_node: Expression = left_node
         self.operator: str = operator
         self.right_node: Expression = right_node
 
-    def type(self) -> NodeType:
-        return NodeType.InfixExpression
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -267,13 +259,13 @@ class InfixExpression(Expression):
         }
 
 class CallExpression(Expression):
+    NODE_TYPE = NodeType.CallExpression
+    __slots__ = ('function', 'arguments')
+
     def __init__(self, function: Expression = None, arguments: list[Expression] = None) -> None:
         self.function = function # IdentifierLiteral
         self.arguments = arguments
 
-    def type(self) -> NodeType:
-        return NodeType.CallExpression
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -284,12 +276,12 @@ class CallExpression(Expression):
 
 # region Literals
 class IntegerLiteral(Expression):
+    NODE_TYPE = NodeType.IntegerLiteral
+    __slots__ = ('value',)
+
     def __init__(self, value: int = None) -> None:
         self.value: int = value
     
-    def type(self) -> NodeType:
-        return NodeType.IntegerLiteral
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -297,12 +289,12 @@ class IntegerLiteral(Expression):
         }
     
 class FloatLiteral(Expression):
+    NODE_TYPE = NodeType.FloatLiteral
+    __slots__ = ('value',)
+
     def __init__(self, value: float = None) -> None:
         self.value: float = value
     
-    def type(self) -> NodeType:
-        return NodeType.FloatLiteral
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -310,12 +302,12 @@ class FloatLiteral(Expression):
         }
     
 class IdentifierLiteral(Expression):
+    NODE_TYPE = NodeType.IdentifierLiteral
+    __slots__ = ('value',)
+
     def __init__(self, value: str = None) -> None:
         self.value: str = value
     
-    def type(self) -> NodeType:
-        return NodeType.IdentifierLiteral
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -323,12 +315,12 @@ class IdentifierLiteral(Expression):
         }
     
 class BooleanLiteral(Expression):
+    NODE_TYPE = NodeType.BooleanLiteral
+    __slots__ = ('value',)
+
     def __init__(self, value: bool = None) -> None:
         self.value: bool = value
     
-    def type(self) -> NodeType:
-        return NodeType.BooleanLiteral
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -336,12 +328,12 @@ class BooleanLiteral(Expression):
         }
     
 class StringLiteral(Expression):
+    NODE_TYPE = NodeType.StringLiteral
+    __slots__ = ('value',)
+
     def __init__(self, value: str = None) -> None:
         self.value: str = value
     
-    def type(self) -> NodeType:
-        return NodeType.StringLiteral
-    
     def json(self) -> dict:
         return {
             "type": self.type().value,
@@ -5,6 +5,7 @@ This module provides the Environment class which acts as a symbol table
 for managing variable and function scopes during compilation.
 """
 
+import sys
 from llvmlite import ir
 from typing import Optional, Tuple
 
@@ -13,19 +14,38 @@ class Environment:
     Symbol Table for managing variable and function scopes.
     
     This class implements a hierarchical symbol table that supports
-    nested scopes through parent-child relationships.
+    nested scopes through parent-child relationships. A lookup walks the
+    parent chain with one dict probe per scope.
     
     Attributes:
-        records: Dictionary mapping names to (value, type) tuples
+        records: Dictionary mapping names to (value, type) tuples for this scope
         parent: Parent environment for nested scopes
         name: Name identifier for this environment scope
+    
+    Symbol names are interned when defined so lookups of the same name
+    hash and compare as pointer-equal strings.
     """
+    __slots__ = ('records', 'parent', 'name')
+
     def __init__(self, records: Optional[dict[str, Tuple[ir.Value, ir.Type]]] = None, 
                  parent: Optional['Environment'] = None, name: str = "global") -> None:
         self.records: dict[str, Tuple[ir.Value, ir.Type]] = records if records else {}
         self.parent: Optional['Environment'] = parent
         self.name: str = name
 
+    def reset(self, parent: Optional['Environment'] = None, name: str = "global") -> None:
+        """
+        Clear this scope's symbols and re-attach it under a new parent, so
+        the environment object can be reused for another scope.
+        
+        Args:
+            parent: Parent environment for the reused scope
+            name: Name identifier for the reused scope
+        """
+        self.records.clear()
+        self.parent = parent
+        self.name = name
+
     def define(self, name: str, value: ir.Value, _type: ir.Type) -> ir.Value:
         """
         Define a new symbol in this environment.
@@ -38,7 +58,7 @@ class Environment:
         Returns:
             The stored value
         """
-        self.records[name] = (value, _type)
+        self.records[sys.intern(name)] = (value, _type)
         return value
     
     def lookup(self, name: str) -> Optional[Tuple[ir.Value, ir.Type]]:
@@ -51,21 +71,10 @@ class Environment:
         Returns:
             Tuple of (value, type) if found, None otherwise
         """
-        return self.__resolve(name)
-    
-    def __resolve(self, name: str) -> Optional[Tuple[ir.Value, ir.Type]]:
-        """
-        Recursively resolve a symbol name through the environment chain.
-        
-        Args:
-            name: Symbol name to resolve
-            
-        Returns:
-            Tuple of (value, type) if found, None otherwise
-        """
-        if name in self.records:
-            return self.records[name]
-        elif self.parent:
-            return self.parent.__resolve(name)
-        else:
-            return None
\ No newline at end of file
+        env: Optional['Environment'] = self
+        while env is not None:
+            record = env.records.get(name)
+            if record is not None:
+                return record
+            env = env.parent
+        return None
@@ -1,4 +1,6 @@
 from llvmlite import ir
+import llvmlite.binding as llvm
+from typing import Callable
 
 from AST import Node, NodeType, Program, Expression
 from AST import ExpressionStatement, LetStatement, FunctionStatement, ReturnStatement, BlockStatement, AssignStatement, IfStatement
@@ -9,6 +11,48 @@ from AST import FunctionParameter
 
 from Envorment import Environment
 
+# Builder methods for arithmetic operators, keyed by (operand type, operator)
+ARITHMETIC_FNS: dict[tuple[str, str], Callable] = {
+    ('int', '+'): ir.IRBuilder.add,
+    ('int', '-'): ir.IRBuilder.sub,
+    ('int', '*'): ir.IRBuilder.mul,
+    ('int', '/'): ir.IRBuilder.sdiv,
+    ('int', '%'): ir.IRBuilder.srem,
+
+    ('float', '+'): ir.IRBuilder.fadd,
+    ('float', '-'): ir.IRBuilder.fsub,
+    ('float', '*'): ir.IRBuilder.fmul,
+    ('float', '/'): ir.IRBuilder.fdiv,
+    ('float', '%'): ir.IRBuilder.frem,
+}
+
+# Comparison operators, all emitted through the compare method for the operand type
+COMPARISON_OPERATORS: frozenset[str] = frozenset(('<', '<=', '>', '>=', '==', '!='))
+COMPARISON_FNS: dict[str, Callable] = {
+    'int': ir.IRBuilder.icmp_signed,
+    'float': ir.IRBuilder.fcmp_ordered,
+}
+
+def create_module_optimizer(opt_level: int) -> Callable[[llvm.ModuleRef], None]:
+    """
+    Returns a function that runs LLVM's standard -O<opt_level> pipeline over a module.
+    Uses the new pass manager when llvmlite provides it (newer releases dropped the legacy
+    PassManagerBuilder), and the legacy builder on releases that predate the new one.
+    """
+    if hasattr(llvm, 'create_pass_builder'):
+        llvm.initialize_native_target()
+        target_machine = llvm.Target.from_default_triple().create_target_machine(opt=opt_level)
+        pass_builder = llvm.create_pass_builder(target_machine, llvm.PipelineTuningOptions(speed_level=opt_level))
+        module_pm = pass_builder.getModulePassManager()
+        return lambda module: module_pm.run(module, pass_builder)
+
+    pmb = llvm.create_pass_manager_builder()
+    pmb.opt_level = opt_level
+
+    module_pm = llvm.create_module_pass_manager()
+    pmb.populate(module_pm)
+    return module_pm.run
+
 class Compiler:
     def __init__(self) -> None:
         self.type_map: dict[str, ir.Type] = {
@@ -33,6 +77,18 @@ class Compiler:
         # Environment reference for the currently compiling scope
         self.env: Environment = Environment()
 
+        # Global constants for every distinct string literal, shared by repeated literals
+        self.string_pool: dict[str, ir.GlobalVariable] = {}
+
+        # Intrinsic declarations, declared lazily on first use
+        self.intrinsics: dict[str, ir.Function] = {}
+
+        # Released scope environments, reused for the next function or loop
+        self.env_pool: list[Environment] = []
+
+        # Identifier resolutions for the current scope, cleared whenever the scope changes
+        self.ident_cache: dict[str, tuple[ir.Value, ir.Type]] = {}
+
         # Temporary keeping track of errors
         self.errors: list[str] = []
 
@@ -40,8 +96,57 @@ class Compiler:
         self.__initialize_builtins()
 
         # Keeps a reference to the compiling loop blocks
-        self.breakpoints: list[ir.Block] = []
-        self.continues: list[ir.Block] = []
+        # Both stacks are preallocated and share loop_depth as their stack pointer
+        self.breakpoints: list[ir.Block | None] = [None] * 16
+        self.continues: list[ir.Block | None] = [None] * 16
+        self.loop_depth: int = 0
+
+        # Visit functions for every compilable node
+        self.visit_fns: dict[NodeType, Callable] = {
+            NodeType.Program: self.__visit_program,
+
+            # Statements
+            NodeType.ExpressionStatement: self.__visit_expression_statement,
+            NodeType.LetStatement: self.__visit_let_statement,
+            NodeType.FunctionStatement: self.__visit_function_statement,
+            NodeType.BlockStatement: self.__visit_block_statement,
+            NodeType.ReturnStatement: self.__visit_return_statement,
+            NodeType.AssignStatement: self.__visit_assign_statement,
+            NodeType.IfStatement: self.__visit_if_statement,
+            NodeType.WhileStatement: self.__visit_while_statement,
+            NodeType.BreakStatement: self.__visit_break_statement,
+            NodeType.ContinueStatement: self.__visit_continue_statement,
+            NodeType.ForStatement: self.__visit_for_statement,
+
+            # Expressions
+            NodeType.InfixExpression: self.__visit_infix_expression,
+            NodeType.CallExpression: self.__visit_call_expression,
+        }
+
+        # Resolve functions for every node that produces a value
+        self.resolve_fns: dict[NodeType, Callable] = {
+            # Literals
+            NodeType.IntegerLiteral: self.__resolve_integer_literal,
+            NodeType.FloatLiteral: self.__resolve_float_literal,
+            NodeType.IdentifierLiteral: self.__resolve_identifier,
+            NodeType.BooleanLiteral: self.__resolve_boolean_literal,
+            NodeType.StringLiteral: self.__resolve_string_literal,
+
+            # Expression Values
+            NodeType.InfixExpression: self.__visit_infix_expression,
+            NodeType.CallExpression: self.__visit_call_expression,
+        }
+
+        # Power implementations for each operand type
+        self.power_fns: dict[str, Callable] = {
+            'int': self.__power_operation,
+            'float': self.__power_operation_float,
+        }
+
+        # Builtin functions that are compiled specially instead of called directly
+        self.builtin_fns: dict[str, Callable] = {
+            'printf': self.__call_builtin_printf,
+        }
 
     def __initialize_builtins(self) -> None:
         def __init_print() -> ir.Function:
@@ -52,64 +157,75 @@ class Compiler:
             )
             return ir.Function(self.module, fnty, 'printf')
         
-        def __init_booleans() -> tuple[ir.GlobalVariable, ir.GlobalVariable]:
-            bool_type: ir.Type = self.type_map['bool']
-
-            true_var = ir.GlobalVariable(self.module, bool_type, 'true')
-            true_var.initializer = ir.Constant(bool_type, 1)
-            true_var.global_constant = True
-
-            false_var = ir.GlobalVariable(self.module, bool_type, 'false')
-            false_var.initializer = ir.Constant(bool_type, 0)
-            false_var.global_constant = True
-
-            return true_var, false_var
-        
         self.env.define('printf', __init_print(), ir.IntType(32))
-        
-        true_var, false_var = __init_booleans()
-        self.env.define('true', true_var, true_var.type)
-        self.env.define('false', false_var, false_var.type)
 
     def __increment_counter(self) -> int:
         self.counter += 1
         return self.counter
 
+    def __push_loop(self, break_block: ir.Block, continue_block: ir.Block) -> None:
+        """ Pushes the break and continue targets of the loop being compiled """
+        if self.loop_depth == len(self.breakpoints):
+            self.breakpoints.append(None)
+            self.continues.append(None)
+        self.breakpoints[self.loop_depth] = break_block
+        self.continues[self.loop_depth] = continue_block
+        self.loop_depth += 1
+
+    def __set_env(self, env: Environment) -> None:
+        """ Switches the compiling scope and drops the identifier cache of the old one """
+        self.env = env
+        self.ident_cache.clear()
+
+    def __acquire_env(self, parent: Environment) -> Environment:
+        """ Returns a child environment of parent, reusing a released one when available """
+        if self.env_pool:
+            env = self.env_pool.pop()
+            env.reset(parent=parent)
+            return env
+        return Environment(parent=parent)
+
+    def __release_env(self, env: Environment) -> None:
+        """ Returns a no longer used environment to the pool """
+        env.reset()
+        self.env_pool.append(env)
+
+    def __define(self, name: str, value: ir.Value, _type: ir.Type) -> None:
+        """ Defines a symbol in the current scope, invalidating any cached resolution """
+        self.env.define(name, value, _type)
+        self.ident_cache.pop(name, None)
+
+    def __lookup(self, name: str) -> tuple[ir.Value, ir.Type] | None:
+        """ Looks up a symbol, reusing the cached resolution for the current scope """
+        record = self.ident_cache.get(name)
+        if record is None:
+            record = self.env.lookup(name)
+            if record is not None:
+                self.ident_cache[name] = record
+        return record
+
     def compile(self, node: Node) -> None:
         """ Main Recursive loop for compiling the AST """
-        match node.type():
-            case NodeType.Program:
-                self.__visit_program(node)
+        visit_fn: Callable | None = self.visit_fns.get(node.NODE_TYPE)
+        if visit_fn is not None:
+            visit_fn(node)
 
-            # Statements
-            case NodeType.ExpressionStatement:
-                self.__visit_expression_statement(node)
-            case NodeType.LetStatement:
-                self.__visit_let_statement(node)
-            case NodeType.FunctionStatement:
-                self.__visit_function_statement(node)
-            case NodeType.BlockStatement:
-                self.__visit_block_statement(node)
-            case NodeType.ReturnStatement:
-                self.__visit_return_statement(node)
-            case NodeType.AssignStatement:
-                self.__visit_assign_statement(node)
-            case NodeType.IfStatement:
-                self.__visit_if_statement(node)
-            case NodeType.WhileStatement:
-                self.__visit_while_statement(node)
-            case NodeType.BreakStatement:
-                self.__visit_break_statement(node)
-            case NodeType.ContinueStatement:
-                self.__visit_continue_statement(node)
-            case NodeType.ForStatement:
-                self.__visit_for_statement(node)
+    def finalize(self, opt_level: int = 0, ir_text: str | None = None) -> llvm.ModuleRef:
+        """
+        Parses the compiled module into LLVM and runs the optimization pipeline once
+        over the whole module, returning the verified and optimized module.
+        Pass `ir_text` when the module has already been stringified to skip re-serializing it.
+        """
+        if ir_text is None:
+            ir_text = str(self.module)
 
-            # Expressions
-            case NodeType.InfixExpression:
-                self.__visit_infix_expression(node)
-            case NodeType.CallExpression:
-                self.__visit_call_expression(node)
+        llvm_module: llvm.ModuleRef = llvm.parse_assembly(ir_text)
+        llvm_module.verify()
+
+        if opt_level > 0:
+            create_module_optimizer(opt_level)(llvm_module)
+
+        return llvm_module
 
     # region Visit Methods
     def __visit_program(self, node: Program) -> None:
@@ -128,7 +244,8 @@ class Compiler:
 
         value, Type = self.__resolve_value(node=value)
 
-        if self.env.lookup(name) is None:
+        record = self.__lookup(name)
+        if record is None:
             # Define and allocate the variable
             ptr = self.builder.alloca(Type)
 
@@ -136,9 +253,9 @@ class Compiler:
             self.builder.store(value, ptr)
 
             # Add the variable to the environment
-            self.env.define(name, ptr, Type)
+            self.__define(name, ptr, Type)
         else:
-            ptr, _ = self.env.lookup(name)
+            ptr, _ = record
             self.builder.store(value, ptr)
 
     def __visit_block_statement(self, node: BlockStatement) -> None:
@@ -156,11 +273,9 @@ class Compiler:
         body: BlockStatement = node.body
         params: list[FunctionParameter] = node.parameters
 
-        # Keep track of the names of each parameter
-        param_names: list[str] = [p.name for p in params]
-
         # Keep track of the types for each parameter
-        param_types: list[ir.Type] = [self.type_map[p.value_type] for p in params]
+        type_map = self.type_map
+        param_types: list[ir.Type] = [type_map[p.value_type] for p in params]
 
         return_type: ir.Type = self.type_map[node.return_type]
 
@@ -173,33 +288,26 @@ class Compiler:
 
         self.builder = ir.IRBuilder(block)
 
-        # Storing the pointers to each parameter
-        params_ptr = []
-        for i, typ in enumerate(param_types):
-            ptr = self.builder.alloca(typ)
-            self.builder.store(func.args[i], ptr)
-            params_ptr.append(ptr)
-
-        # Add function to parent environment first (for recursion)
+        # Add function to parent environment (reachable from the body for recursion)
         previous_env = self.env
-        self.env.define(name, func, return_type)
+        self.__define(name, func, return_type)
         
         # Create new environment for function body
-        self.env = Environment(parent=previous_env)
+        self.__set_env(self.__acquire_env(previous_env))
         
-        # Add parameters to the function environment
-        for i, x in enumerate(zip(param_types, param_names)):
-            typ = param_types[i]
-            ptr = params_ptr[i]
-            self.env.define(x[1], ptr, typ)
-
-        # Add function to its own environment (for recursion)
-        self.env.define(name, func, return_type)
+        # Store each parameter to its own slot and add it to the function environment
+        alloca = self.builder.alloca
+        store = self.builder.store
+        for param, typ, arg in zip(params, param_types, func.args):
+            ptr = alloca(typ)
+            store(arg, ptr)
+            self.__define(param.name, ptr, typ)
 
         self.compile(body)
 
         # Restore previous environment
-        self.env = previous_env
+        self.__release_env(self.env)
+        self.__set_env(previous_env)
 
         self.builder = previous_builder
 
@@ -209,10 +317,11 @@ class Compiler:
 
         value, Type = self.__resolve_value(value)
 
-        if self.env.lookup(name) is None:
+        record = self.__lookup(name)
+        if record is None:
             self.errors.append(f"COMPILE ERROR: Identifier '{name}' has not been declared before it was re-assigned.")
         else:
-            ptr, _ = self.env.lookup(name)
+            ptr, _ = record
             self.builder.store(value, ptr)
 
     def __visit_if_statement(self, node: IfStatement) -> None:
@@ -260,39 +369,56 @@ class Compiler:
         condition: Expression = node.condition
         body: BlockStatement = node.body
 
-        test, _ = self.__resolve_value(condition)
+        # Header block that evaluates the condition on every iteration
+        while_loop_header = self.builder.append_basic_block(f"while_loop_header_{self.__increment_counter()}")
 
         # Entry block that runs if the condition is true
-        while_loop_entry = self.builder.append_basic_block(f"while_loop_entry_{self.__increment_counter()}")
+        while_loop_entry = self.builder.append_basic_block(f"while_loop_entry_{self.counter}")
 
         # If the condition is false, it runs from this block
         while_loop_otherwise = self.builder.append_basic_block(f"while_loop_otherwise_{self.counter}")
 
+        self.builder.branch(while_loop_header)
+        self.builder.position_at_start(while_loop_header)
+
         # Creating a condition branch
-        #     condition
-        #        / \
-        # if true   if false
-        #       /   \
-        #      /     \
+        #     condition  <----+
+        #        / \          |
+        # if true   if false  |
+        #       /   \         |
+        #      /     \        |
         # true block  false block
+        #      |              |
+        #      +--------------+
+        test, _ = self.__resolve_value(condition)
         self.builder.cbranch(test, while_loop_entry, while_loop_otherwise)
 
+        self.__push_loop(while_loop_otherwise, while_loop_header)
+
         # Setting the builder position-at-start
         self.builder.position_at_start(while_loop_entry)
 
         # Compile the body of the while statement
         self.compile(body)
 
-        test, _ = self.__resolve_value(condition)
+        if not self.builder.block.is_terminated:
+            self.builder.branch(while_loop_header)
 
-        self.builder.cbranch(test, while_loop_entry, while_loop_otherwise)
         self.builder.position_at_start(while_loop_otherwise)
 
+        self.loop_depth -= 1
+
     def __visit_break_statement(self, node: BreakStatement) -> None:
-        self.builder.branch(self.breakpoints[-1])
+        if self.loop_depth == 0:
+            self.errors.append("COMPILE ERROR: 'break' used outside of a loop.")
+            return
+        self.builder.branch(self.breakpoints[self.loop_depth - 1])
 
     def __visit_continue_statement(self, node: ContinueStatement) -> None:
-        self.builder.branch(self.continues[-1])
+        if self.loop_depth == 0:
+            self.errors.append("COMPILE ERROR: 'continue' used outside of a loop.")
+            return
+        self.builder.branch(self.continues[self.loop_depth - 1])
 
     def __visit_for_statement(self, node: ForStatement) -> None:
         var_declaration: LetStatement = node.var_declaration
@@ -302,7 +428,7 @@ class Compiler:
 
         # Creating a new environment specifically for the for statement
         previous_env = self.env
-        self.env = Environment(parent=previous_env)
+        self.__set_env(self.__acquire_env(previous_env))
 
         # Compile the let statement
         self.compile(var_declaration)
@@ -310,8 +436,7 @@ class Compiler:
         for_loop_entry = self.builder.append_basic_block(f"for_loop_entry_{self.__increment_counter()}")
         for_loop_otherwise = self.builder.append_basic_block(f"for_loop_otherwise_{self.counter}")
 
-        self.breakpoints.append(for_loop_otherwise)
-        self.continues.append(for_loop_entry)
+        self.__push_loop(for_loop_otherwise, for_loop_entry)
 
         self.builder.branch(for_loop_entry)
         self.builder.position_at_start(for_loop_entry)
@@ -326,83 +451,37 @@ class Compiler:
 
         self.builder.position_at_start(for_loop_otherwise)
 
-        self.breakpoints.pop()
-        self.continues.pop()
+        self.loop_depth -= 1
+
+        # Restore previous environment
+        self.__release_env(self.env)
+        self.__set_env(previous_env)
     # endregion
         
     # region Expressions
-    def __visit_infix_expression(self, node: InfixExpression) -> None:
+    def __visit_infix_expression(self, node: InfixExpression) -> tuple[ir.Value, ir.Type]:
         operator: str = node.operator
         left_value, left_type = self.__resolve_value(node.left_node)
         right_value, right_type = self.__resolve_value(node.right_node)
 
-        value = None
-        Type = None
         if isinstance(right_type, ir.IntType) and isinstance(left_type, ir.IntType):
-            Type = self.type_map['int']
-            match operator:
-                case '+':
-                    value = self.builder.add(left_value, right_value)
-                case '-':
-                    value = self.builder.sub(left_value, right_value)
-                case '*':
-                    value = self.builder.mul(left_value, right_value)
-                case '/':
-                    value = self.builder.sdiv(left_value, right_value)
-                case '%':
-                    value = self.builder.srem(left_value, right_value)
-                case '^':
-                    # Power operation for integers
-                    value = self.__power_operation(left_value, right_value, Type)
-                case '<':
-                    value = self.builder.icmp_signed('<', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '<=':
-                    value = self.builder.icmp_signed('<=', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '>':
-                    value = self.builder.icmp_signed('>', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '>=':
-                    value = self.builder.icmp_signed('>=', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '==':
-                    value = self.builder.icmp_signed('==', left_value, right_value)
-                    Type = ir.IntType(1)
-                
+            tag = 'int'
         elif isinstance(right_type, ir.FloatType) and isinstance(left_type, ir.FloatType):
-            Type = ir.FloatType()
-            match operator:
-                case '+':
-                    value = self.builder.fadd(left_value, right_value)
-                case '-':
-                    value = self.builder.fsub(left_value, right_value)
-                case '*':
-                    value = self.builder.fmul(left_value, right_value)
-                case '/':
-                    value = self.builder.fdiv(left_value, right_value)
-                case '%':
-                    value = self.builder.frem(left_value, right_value)
-                case '^':
-                    # Power operation for floats
-                    value = self.__power_operation_float(left_value, right_value, Type)
-                case '<':
-                    value = self.builder.fcmp_ordered('<', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '<=':
-                    value = self.builder.fcmp_ordered('<=', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '>':
-                    value = self.builder.fcmp_ordered('>', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '>=':
-                    value = self.builder.fcmp_ordered('>=', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '==':
-                    value = self.builder.fcmp_ordered('==', left_value, right_value)
-                    Type = ir.IntType(1)
-
-        return value, Type
+            tag = 'float'
+        else:
+            return None, None
+
+        if operator in COMPARISON_OPERATORS:
+            return COMPARISON_FNS[tag](self.builder, operator, left_value, right_value), ir.IntType(1)
+
+        Type = self.type_map[tag]
+        if operator == '^':
+            return self.power_fns[tag](left_value, right_value, Type), Type
+
+        op_fn: Callable | None = ARITHMETIC_FNS.get((tag, operator))
+        if op_fn is None:
+            return None, Type
+        return op_fn(self.builder, left_value, right_value), Type
     
     def __visit_call_expression(self, node: CallExpression) -> tuple[ir.Instruction, ir.Type]:
         name: str = node.function.value
@@ -416,13 +495,12 @@ class Compiler:
                 args.append(p_val)
                 types.append(p_type)
 
-        match name:
-            case 'printf':
-                ret = self.builtin_printf(params=args, return_type=types[0])
-                ret_type = self.type_map['int']
-            case _:
-                func, ret_type = self.env.lookup(name)
-                ret = self.builder.call(func, args)
+        builtin_fn: Callable | None = self.builtin_fns.get(name)
+        if builtin_fn is not None:
+            return builtin_fn(args, types)
+
+        func, ret_type = self.__lookup(name)
+        ret = self.builder.call(func, args)
         
         return ret, ret_type
     # endregion
@@ -432,40 +510,39 @@ class Compiler:
     # region Helper Methods
     def __resolve_value(self, node: Expression) -> tuple[ir.Value, ir.Type]:
         """ Resolves a value and returns a tuple (ir_value, ir_type) """
-        match node.type():
-            # Literals
-            case NodeType.IntegerLiteral:
-                node: IntegerLiteral = node
-                value, Type = node.value, self.type_map['int']
-                return ir.Constant(Type, value), Type
-            case NodeType.FloatLiteral:
-                node: FloatLiteral = node
-                value, Type = node.value, self.type_map['float']
-                return ir.Constant(Type, value), Type
-            case NodeType.IdentifierLiteral:
-                node: IdentifierLiteral = node
-                ptr, Type = self.env.lookup(node.value)
-                return self.builder.load(ptr), Type
-            case NodeType.BooleanLiteral:
-                node: BooleanLiteral = node
-                print(node.value)
-                return ir.Constant(ir.IntType(1), 1 if node.value else 0), ir.IntType(1)
-            case NodeType.StringLiteral:
-                node: StringLiteral = node
-                string, Type = self.__convert_string(node.value)
-                return string, Type
-            
-            # Expression Values
-            case NodeType.InfixExpression:
-                return self.__visit_infix_expression(node)
-            case NodeType.CallExpression:
-                return self.__visit_call_expression(node)
+        resolve_fn: Callable | None = self.resolve_fns.get(node.NODE_TYPE)
+        if resolve_fn is None:
+            return None
+        return resolve_fn(node)
+
+    def __resolve_integer_literal(self, node: IntegerLiteral) -> tuple[ir.Constant, ir.Type]:
+        Type = self.type_map['int']
+        return ir.Constant(Type, node.value), Type
+
+    def __resolve_float_literal(self, node: FloatLiteral) -> tuple[ir.Constant, ir.Type]:
+        Type = self.type_map['float']
+        return ir.Constant(Type, node.value), Type
+
+    def __resolve_identifier(self, node: IdentifierLiteral) -> tuple[ir.Instruction, ir.Type]:
+        ptr, Type = self.__lookup(node.value)
+        return self.builder.load(ptr), Type
+
+    def __resolve_boolean_literal(self, node: BooleanLiteral) -> tuple[ir.Constant, ir.Type]:
+        bool_type: ir.Type = self.type_map['bool']
+        return ir.Constant(bool_type, 1 if node.value else 0), bool_type
+
+    def __resolve_string_literal(self, node: StringLiteral) -> tuple[ir.GlobalVariable, ir.Type]:
+        string, Type = self.__convert_string(node.value)
+        return string, Type
             
     def __convert_string(self, string: str) -> tuple[ir.Constant, ir.ArrayType]:
-        string = string.replace('\\n', '\n\0')
-        
-        fmt: str = f"{string}\0"
-        c_fmt: ir.Constant = ir.Constant(ir.ArrayType(ir.IntType(8), len(fmt)), bytearray(fmt.encode("utf8")))
+        global_fmt: ir.GlobalVariable | None = self.string_pool.get(string)
+        if global_fmt is not None:
+            return global_fmt, global_fmt.type
+
+        # Escape sequences were already decoded by the lexer
+        fmt: bytes = f"{string}\0".encode("utf8")
+        c_fmt: ir.Constant = ir.Constant(ir.ArrayType(ir.IntType(8), len(fmt)), bytearray(fmt))
 
         # Make the global variable for the string
         global_fmt = ir.GlobalVariable(self.module, c_fmt.type, name=f'__str_{self.__increment_counter()}')
@@ -473,28 +550,67 @@ class Compiler:
         global_fmt.global_constant = True
         global_fmt.initializer = c_fmt
 
+        self.string_pool[string] = global_fmt
+
         return global_fmt, global_fmt.type
 
     def __power_operation(self, base: ir.Value, exponent: ir.Value, result_type: ir.Type) -> ir.Value:
         """
-        Implement integer power operation using repeated multiplication.
-        For now, this is a simple implementation that works for small positive exponents.
+        Implement integer power operation inline using exponentiation by squaring.
+        A zero exponent yields 1. Negative exponents give 1 / base^-exp truncated
+        toward zero, as the float pow path did: 1 for base 1, +/-1 for base -1
+        depending on the exponent's parity, and 0 for any other base.
         """
-        # Create a simple loop to compute base^exponent
-        # This is a basic implementation - a real compiler might use more efficient algorithms
-        
-        # For simplicity, we'll implement this as a function call to a builtin power function
-        # In a full implementation, you'd want to generate the loop inline or call libm
-        
-        # Convert to float, use float power, then convert back to int
-        base_float = self.builder.sitofp(base, ir.FloatType())
-        exp_float = self.builder.sitofp(exponent, ir.FloatType())
-        
-        # Call the float power function
-        result_float = self.__power_operation_float(base_float, exp_float, ir.FloatType())
-        
-        # Convert back to integer
-        return self.builder.fptosi(result_float, result_type)
+        #        entry
+        #          |
+        #   +--> pow_cond --(exp <= 0)--> pow_end
+        #   |      |
+        #   +-- pow_body
+        entry_block = self.builder.block
+        cond_block = self.builder.append_basic_block(f"pow_cond_{self.__increment_counter()}")
+        body_block = self.builder.append_basic_block(f"pow_body_{self.counter}")
+        end_block = self.builder.append_basic_block(f"pow_end_{self.counter}")
+
+        self.builder.branch(cond_block)
+
+        self.builder.position_at_start(cond_block)
+        result = self.builder.phi(result_type)
+        factor = self.builder.phi(result_type)
+        exp = self.builder.phi(result_type)
+        keep_going = self.builder.icmp_signed('>', exp, ir.Constant(result_type, 0))
+        self.builder.cbranch(keep_going, body_block, end_block)
+
+        # Multiply the result in when the lowest exponent bit is set, then square the factor
+        self.builder.position_at_start(body_block)
+        odd = self.builder.icmp_signed('!=', self.builder.and_(exp, ir.Constant(result_type, 1)), ir.Constant(result_type, 0))
+        next_result = self.builder.select(odd, self.builder.mul(result, factor), result)
+        next_factor = self.builder.mul(factor, factor)
+        next_exp = self.builder.ashr(exp, ir.Constant(result_type, 1))
+        self.builder.branch(cond_block)
+
+        result.add_incoming(ir.Constant(result_type, 1), entry_block)
+        result.add_incoming(next_result, body_block)
+        factor.add_incoming(base, entry_block)
+        factor.add_incoming(next_factor, body_block)
+        exp.add_incoming(exponent, entry_block)
+        exp.add_incoming(next_exp, body_block)
+
+        # Negative exponents never enter the loop; pick their truncated result instead
+        self.builder.position_at_start(end_block)
+        one = ir.Constant(result_type, 1)
+        minus_one = ir.Constant(result_type, -1)
+        exponent_odd = self.builder.icmp_signed('!=', self.builder.and_(exponent, one), ir.Constant(result_type, 0))
+        negative_result = self.builder.select(
+            self.builder.icmp_signed('==', base, one),
+            one,
+            self.builder.select(
+                self.builder.icmp_signed('==', base, minus_one),
+                self.builder.select(exponent_odd, minus_one, one),
+                ir.Constant(result_type, 0),
+            ),
+        )
+        is_negative = self.builder.icmp_signed('<', exponent, ir.Constant(result_type, 0))
+        return self.builder.select(is_negative, negative_result, result)
     
     def __power_operation_float(self, base: ir.Value, exponent: ir.Value, result_type: ir.Type) -> ir.Value:
         """
@@ -503,16 +619,19 @@ class Compiler:
         # Declare the pow function if not already declared
         pow_func_name = "llvm.pow.f64" if result_type == ir.DoubleType() else "llvm.pow.f32"
         
-        try:
-            pow_func = self.module.get_global(pow_func_name)
-        except KeyError:
+        pow_func: ir.Function | None = self.intrinsics.get(pow_func_name)
+        if pow_func is None:
             # Declare the LLVM pow intrinsic
             pow_func_type = ir.FunctionType(result_type, [result_type, result_type])
             pow_func = ir.Function(self.module, pow_func_type, pow_func_name)
+            self.intrinsics[pow_func_name] = pow_func
         
         # Call the pow function
         return self.builder.call(pow_func, [base, exponent])
 
+    def __call_builtin_printf(self, args: list[ir.Value], types: list[ir.Type]) -> tuple[ir.Instruction, ir.Type]:
+        return self.builtin_printf(params=args, return_type=types[0]), self.type_map['int']
+
     def builtin_printf(self, params: list[ir.Instruction], return_type: ir.Type) -> None:
         """ Basic C builtin printf """
         func, _ = self.env.lookup('printf')
@@ -535,7 +654,7 @@ class Compiler:
             """ Printing from a normal string declared within printf """
             # print("yeet %i", 23)
             # TODO: HANDLE PRINTING FLOATS
-            fmt_arg = self.builder.bitcast(self.module.get_global(f"__str_{self.counter}"), ir.IntType(8).as_pointer())
+            fmt_arg = self.builder.bitcast(params[0], ir.IntType(8).as_pointer())
 
             return self.builder.call(func, [fmt_arg, *rest_params])
     # endregion
\ No newline at end of file
@@ -28,7 +28,17 @@ class OutputFormat(Enum):
     BITCODE = "bitcode"
 
 
-@dataclass
+# File extension used for each output format
+OUTPUT_EXTENSIONS: dict[OutputFormat, str] = {
+    OutputFormat.EXECUTABLE: ".exe" if os.name == 'nt' else "",
+    OutputFormat.OBJECT: ".o",
+    OutputFormat.ASSEMBLY: ".s",
+    OutputFormat.LLVM_IR: ".ll",
+    OutputFormat.BITCODE: ".bc",
+}
+
+
+@dataclass(slots=True)
 class CompilerConfig:
     """
     Comprehensive configuration for the Forg compiler.
@@ -45,6 +55,7 @@ class CompilerConfig:
     # Debug flags
     lexer_debug: bool = False
     parser_debug: bool = False
+    ast_compact: bool = False  # Write the AST debug JSON without indentation
     compiler_debug: bool = False
     ast_debug: bool = False
     ir_debug: bool = False
@@ -73,13 +84,13 @@ class CompilerConfig:
     
     def __post_init__(self):
         """Validate configuration after initialization."""
-        # Create debug directory if it doesn't exist
-        if not os.path.exists(self.debug_dir):
-            os.makedirs(self.debug_dir)
-            
-        # Create output directory if it doesn't exist
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        # Create the debug and output directories if they don't exist,
+        # tolerating read-only locations (e.g. when embedded in a JIT REPL)
+        for directory in (self.debug_dir, self.output_dir):
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError:
+                pass
     
     @classmethod
     def from_args(cls, args) -> 'CompilerConfig':
@@ -95,6 +106,8 @@ class CompilerConfig:
             config.lexer_debug = args.debug_lexer
         if hasattr(args, 'debug_parser'):
             config.parser_debug = args.debug_parser
+        if hasattr(args, 'debug_parser_compact'):
+            config.ast_compact = args.debug_parser_compact
         if hasattr(args, 'debug_compiler'):
             config.compiler_debug = args.debug_compiler
         if hasattr(args, 'verbose'):
@@ -125,20 +138,8 @@ class CompilerConfig:
             
         if self.input_file:
             base_name = os.path.splitext(os.path.basename(self.input_file))[0]
-            
-            if self.output_format == OutputFormat.EXECUTABLE:
-                extension = ".exe" if os.name == 'nt' else ""
-            elif self.output_format == OutputFormat.OBJECT:
-                extension = ".o"
-            elif self.output_format == OutputFormat.ASSEMBLY:
-                extension = ".s"
-            elif self.output_format == OutputFormat.LLVM_IR:
-                extension = ".ll"
-            elif self.output_format == OutputFormat.BITCODE:
-                extension = ".bc"
-            else:
-                extension = ""
-                
+            extension = OUTPUT_EXTENSIONS.get(self.output_format, "")
+
             return os.path.join(self.output_dir, f"{base_name}{extension}")
         
         return os.path.join(self.output_dir, "output")
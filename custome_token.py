@@ -5,64 +5,74 @@ This module defines the token types and token class used by the lexer
 to represent different elements of the Forg programming language.
 """
 
-from enum import Enum
+import re
+import sys
+from enum import IntEnum, auto
+from types import MappingProxyType
 from typing import Any
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    """
+    Token kinds as small integers, so the parser's hot `==` checks and
+    table lookups compare plain ints instead of going through Enum.__eq__.
+    """
     # Special Tokens
-    EOF = "EOF"
-    ILLEGAL = "ILLEGAL"
+    EOF = auto()
+    ILLEGAL = auto()
 
     # Data Types
-    IDENT = "IDENT"
-    INT = "INT"
-    FLOAT = "FLOAT"
-    STRING = "STRING"
+    IDENT = auto()
+    INT = auto()
+    FLOAT = auto()
+    STRING = auto()
 
     # Arithmetic Symbols
-    PLUS = "PLUS"
-    MINUS = "MINUS"
-    ASTERISK = "ASTERISK"
-    SLASH = "SLASH"
-    POW = "POW"
-    MODULUS = "MODULUS"
+    PLUS = auto()
+    MINUS = auto()
+    ASTERISK = auto()
+    SLASH = auto()
+    POW = auto()
+    MODULUS = auto()
 
     # Assignment Symbols
-    EQ = "EQ"
+    EQ = auto()
 
     # Comparison Symbols
-    LT = '<'
-    GT = '>'
-    EQ_EQ = '=='
-    NOT_EQ = '!='
-    LT_EQ = '<='
-    GT_EQ = '>='
+    LT = auto()
+    GT = auto()
+    EQ_EQ = auto()
+    NOT_EQ = auto()
+    LT_EQ = auto()
+    GT_EQ = auto()
 
     # Symbols
-    COLON = "COLON"
-    COMMA = "COMMA"
-    SEMICOLON = "SEMICOLON"
-    ARROW = "ARROW"
-    LPAREN = "LPAREN"
-    RPAREN = "RPAREN"
-    LBRACE = "LBRACE"
-    RBRACE = "RBRACE"
+    COLON = auto()
+    COMMA = auto()
+    SEMICOLON = auto()
+    ARROW = auto()
+    LPAREN = auto()
+    RPAREN = auto()
+    LBRACE = auto()
+    RBRACE = auto()
 
     # Keywords
-    LET = "LET"
-    FN = "FN"
-    RETURN = "RETURN"
-    IF = "IF"
-    ELSE = "ELSE"
-    TRUE = "TRUE"
-    FALSE = "FALSE"
-    WHILE = "WHILE"
-    BREAK = "BREAK"
-    CONTINUE = "CONTINUE"
-    FOR = "FOR"
+    LET = auto()
+    FN = auto()
+    RETURN = auto()
+    IF = auto()
+    ELSE = auto()
+    TRUE = auto()
+    FALSE = auto()
+    WHILE = auto()
+    BREAK = auto()
+    CONTINUE = auto()
+    FOR = auto()
 
     # Typing
-    TYPE = "TYPE"
+    TYPE = auto()
+
+    def __str__(self) -> str:
+        return f"TokenType.{self.name}"
 
 
 class Token:
@@ -75,7 +85,9 @@ class Token:
         line_no: Line number where the token appears
         position: Character position in the line
     """
-    def __init__(self, type: TokenType, literal: Any, line_no: int, position: int) -> None:
+    __slots__ = ('type', 'literal', 'line_no', 'position')
+
+    def __init__(self, type: TokenType, literal: Any, line_no: int, position: int, /) -> None:
         self.type = type
         self.literal = literal
         self.line_no = line_no
@@ -83,12 +95,11 @@ class Token:
 
     def __str__(self) -> str:
         return f"Token[{self.type} : {self.literal} : Line {self.line_no} : Position {self.position}]"
-    
-    def __repr__(self) -> str:
-        return str(self)
+
+    __repr__ = __str__
     
 
-KEYWORDS: dict[str, TokenType] = {
+KEYWORDS: MappingProxyType[str, TokenType] = MappingProxyType({
     "let": TokenType.LET,
     "fn": TokenType.FN,
     "return": TokenType.RETURN,
@@ -100,9 +111,9 @@ KEYWORDS: dict[str, TokenType] = {
     "break": TokenType.BREAK,
     "continue": TokenType.CONTINUE,
     "for": TokenType.FOR,
-}
+})
 
-ALT_KEYWORDS: dict[str, TokenType] = {
+ALT_KEYWORDS: MappingProxyType[str, TokenType] = MappingProxyType({
     "lit": TokenType.LET,
     "be": TokenType.EQ,
     "rn": TokenType.SEMICOLON,
@@ -115,20 +126,36 @@ ALT_KEYWORDS: dict[str, TokenType] = {
     "yeet": TokenType.BREAK,
     "anothaone": TokenType.CONTINUE,
     "dab": TokenType.FOR,
+})
+
+TYPE_KEYWORDS: frozenset[str] = frozenset(("int", "float", "str", "void"))
+
+# Alt keywords that aren't identifier-shaped (e.g. "3--D") never reach lookup_ident,
+# so the lexer matches them against the source directly, longest first
+ALT_SYMBOL_KEYWORDS: MappingProxyType[str, TokenType] = MappingProxyType(
+    {k: v for k, v in ALT_KEYWORDS.items() if not k.isidentifier()}
+)
+ALT_SYMBOL_STARTS: frozenset[str] = frozenset(k[0] for k in ALT_SYMBOL_KEYWORDS)
+ALT_SYMBOL_PATTERN: re.Pattern = re.compile(
+    "|".join(re.escape(k) for k in sorted(ALT_SYMBOL_KEYWORDS, key=len, reverse=True))
+)
+
+# Every identifier-shaped reserved word in one table, so identifiers are classified with a single probe.
+# Later entries win, which keeps KEYWORDS ahead of ALT_KEYWORDS ahead of TYPE_KEYWORDS.
+ALL_KEYWORDS: dict[str, TokenType] = {
+    sys.intern(k): v for k, v in {
+        **{k: TokenType.TYPE for k in TYPE_KEYWORDS},
+        **{k: v for k, v in ALT_KEYWORDS.items() if k not in ALT_SYMBOL_KEYWORDS},
+        **KEYWORDS,
+    }.items()
 }
 
-TYPE_KEYWORDS: list[str] = ["int", "float", "str", "void"]
+_lookup_keyword = ALL_KEYWORDS.get
+
+def intern_ident(ident: str) -> str:
+    """ Returns the shared copy of an identifier, so repeated names are one object """
+    return sys.intern(ident)
 
 def lookup_ident(ident: str) -> TokenType:
-    tt: TokenType | None = KEYWORDS.get(ident)
-    if tt is not None:
-        return tt
-    
-    tt: TokenType | None = ALT_KEYWORDS.get(ident)
-    if tt is not None:
-        return tt
-    
-    if ident in TYPE_KEYWORDS:
-        return TokenType.TYPE
-    
-    return TokenType.IDENT
\ No newline at end of file
+    """ Classifies an identifier-shaped word; symbol-shaped alt keywords are matched by the lexer """
+    return _lookup_keyword(ident, TokenType.IDENT)
@@ -5,9 +5,10 @@ This module provides comprehensive error handling and reporting
 capabilities for the Forg compiler pipeline.
 """
 
+import sys
 from enum import Enum
 from typing import List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 class ErrorType(Enum):
@@ -20,7 +21,7 @@ class ErrorType(Enum):
     INTERNAL = "Internal Compiler Error"
 
 
-@dataclass
+@dataclass(slots=True)
 class CompilerError:
     """
     Represents a compiler error with detailed information.
@@ -39,9 +40,15 @@ class CompilerError:
     position: int = 0
     source_file: Optional[str] = None
     suggestion: Optional[str] = None
+    _formatted: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __str__(self) -> str:
-        """Format error for display."""
+        """Format error for display, building the message only once."""
+        if self._formatted is None:
+            self._formatted = self.__format()
+        return self._formatted
+    
+    def __format(self) -> str:
         location = f"Line {self.line_no}"
         if self.position > 0:
             location += f", Column {self.position}"
@@ -93,11 +100,11 @@ class ErrorHandler:
         
     def has_errors(self) -> bool:
         """Check if any errors have been recorded."""
-        return len(self.errors) > 0
+        return bool(self.errors)
         
     def has_warnings(self) -> bool:
         """Check if any warnings have been recorded."""
-        return len(self.warnings) > 0
+        return bool(self.warnings)
         
     def get_error_count(self) -> int:
         """Get the total number of errors."""
@@ -110,25 +117,26 @@ class ErrorHandler:
     def print_errors(self) -> None:
         """Print all errors to stdout."""
         if self.has_errors():
-            print(f"\n{self.get_error_count()} error(s) found:")
-            for error in self.errors:
-                print(f"  {error}")
+            out = "\n".join(f"  {error}" for error in self.errors)
+            sys.stdout.write(f"\n{self.get_error_count()} error(s) found:\n{out}\n")
                 
     def print_warnings(self) -> None:
         """Print all warnings to stdout."""
         if self.has_warnings():
-            print(f"\n{self.get_warning_count()} warning(s) found:")
-            for warning in self.warnings:
-                print(f"  {warning}")
+            out = "\n".join(f"  {warning}" for warning in self.warnings)
+            sys.stdout.write(f"\n{self.get_warning_count()} warning(s) found:\n{out}\n")
                 
     def print_summary(self) -> None:
         """Print a summary of all errors and warnings."""
+        has_errors = bool(self.errors)
+        has_warnings = bool(self.warnings)
+        
         self.print_errors()
         self.print_warnings()
         
-        if not self.has_errors() and not self.has_warnings():
+        if not has_errors and not has_warnings:
             print("No errors or warnings found.")
-        elif not self.has_errors():
+        elif not has_errors:
             print("Compilation successful with warnings.")
         else:
             print("Compilation failed due to errors.")
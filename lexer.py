@@ -1,8 +1,27 @@
-from custome_token import Token, TokenType, lookup_ident
+from custome_token import Token, TokenType, ALT_SYMBOL_KEYWORDS, ALT_SYMBOL_PATTERN, ALT_SYMBOL_STARTS, intern_ident, lookup_ident
 from typing import Any
+import re
+
+# Characters produced by backslash escape sequences inside string literals
+ESCAPE_SEQUENCES: dict[str, str] = {
+    'n': '\n',
+    't': '\t',
+    '\\': '\\',
+    '"': '"',
+}
+
+# Runs the lexer consumes in bulk, matched in C instead of char by char
+WHITESPACE: str = ' \t\n\r'
+WHITESPACE_RUN: re.Pattern = re.compile(r'[ \t\n\r]*')
+IDENT_TAIL: re.Pattern = re.compile(r'\w*')
+NUMBER: re.Pattern = re.compile(r'[0-9]*(?:\.[0-9]*)?')
 
 class Lexer:
     def __init__(self, source: str) -> None:
+        self.reset(source)
+
+    def reset(self, source: str) -> None:
+        """ Starts lexing new source input, so one Lexer instance can be reused """
         self.source = source
 
         self.position: int = -1
@@ -23,6 +42,11 @@ class Lexer:
         self.position = self.read_position
         self.read_position += 1
 
+    def __advance_to(self, position: int) -> None:
+        """ Moves the lexer straight to `position`, as if __read_char had been called up to it """
+        self.read_position = position
+        self.__read_char()
+
     def __peek_char(self) -> str | None:
         """ Peeks to the upcoming char without advancing the lexer position """
         if self.read_position >= len(self.source):
@@ -32,12 +56,14 @@ class Lexer:
     
     def __skip_whitespace(self) -> None:
         """ Skips whitespace and other ignored characters """
-        while self.current_char in [' ', '\t', '\n', '\r']:
-            # Advance the line number if this is a line break
-            if self.current_char == '\n':
-                self.line_no += 1
-            
-            self.__read_char()
+        if self.current_char is None or self.current_char not in WHITESPACE:
+            return
+
+        end: int = WHITESPACE_RUN.match(self.source, self.position).end()
+
+        # Advance the line number for every line break skipped
+        self.line_no += self.source.count('\n', self.position, end)
+        self.__advance_to(end)
     
     def __skip_comment(self) -> None:
         """ Skips single-line comments starting with // """
@@ -56,7 +82,7 @@ class Lexer:
 
     def __new_token(self, tt: TokenType, literal: Any) -> Token:
         """ Creates and returns a new token from specified values """
-        return Token(type=tt, literal=literal, line_no=self.line_no, position=self.position)
+        return Token(tt, literal, self.line_no, self.position)
     
     def __is_digit(self, ch: str) -> bool:
         """ Checks if the character is a digit """
@@ -68,35 +94,50 @@ class Lexer:
     def __read_number(self) -> Token:
         """ Reads a number from the input file and returns a Token """
         start_pos: int = self.position
-        dot_count: int = 0
-
-        output: str = ""
-        while self.__is_digit(self.current_char) or self.current_char == '.':
-            if self.current_char == '.':
-                dot_count += 1
-            
-            if dot_count > 1:
-                print(f"Too many decimals in number on line {self.line_no}, position {self.position}")
-                return self.__new_token(TokenType.ILLEGAL, self.source[start_pos:self.position])
-            
-            output += self.source[self.position]
-            self.__read_char()
 
-            if self.current_char is None:
-                break
+        end: int = NUMBER.match(self.source, start_pos).end()
+        output: str = self.source[start_pos:end]
+        self.__advance_to(end)
 
-        if dot_count == 0:
+        if self.current_char == '.':
+            print(f"Too many decimals in number on line {self.line_no}, position {self.position}")
+            return self.__new_token(TokenType.ILLEGAL, output)
+
+        if '.' not in output:
             return self.__new_token(TokenType.INT, int(output))
         else:
             return self.__new_token(TokenType.FLOAT, float(output))
         
     def __read_identifier(self) -> str:
         position = self.position
-        while self.current_char is not None and (self.__is_letter(self.current_char) or self.current_char.isalnum()):
-            self.__read_char()
+        self.__advance_to(IDENT_TAIL.match(self.source, position).end())
         
         return self.source[position:self.position]
     
+    def __read_alt_symbol(self) -> Token | None:
+        """ Reads a symbol-shaped alt keyword (e.g. 3--D) at the current position, if there is one """
+        match = ALT_SYMBOL_PATTERN.match(self.source, self.position)
+        if match is None:
+            return None
+
+        # Land on the keyword's last char, like the other multi-char tokens
+        for _ in range(len(match.group()) - 1):
+            self.__read_char()
+
+        tok = self.__new_token(ALT_SYMBOL_KEYWORDS[match.group()], match.group())
+        self.__read_char()
+        return tok
+
+    def tokenize_all(self) -> tuple[Token, ...]:
+        """ Lexes the rest of the input in one call, returning every token up to the end of input """
+        tokens: list[Token] = []
+        append = tokens.append
+        next_token = self.next_token
+        while self.current_char is not None:
+            append(next_token())
+
+        return tuple(tokens)
+
     def next_token(self) -> list[Token]:
         """
             Main function for executing the Lexer
@@ -106,6 +147,11 @@ class Lexer:
         # Skip the whitespace and ignored characters
         self.__skip_whitespace()
 
+        if self.current_char in ALT_SYMBOL_STARTS:
+            tok = self.__read_alt_symbol()
+            if tok is not None:
+                return tok
+
         match self.current_char:
             case '+':
                 tok = self.__new_token(TokenType.PLUS, self.current_char)
@@ -183,10 +229,8 @@ class Lexer:
                 tok = self.__new_token(TokenType.EOF, "")
             case _:
                 if self.__is_letter(self.current_char):
-                    literal: str = self.__read_identifier()
-                    tt: TokenType = lookup_ident(literal)
-                    tok = self.__new_token(tt=tt, literal=literal)
-                    return tok
+                    literal: str = intern_ident(self.__read_identifier())
+                    return self.__new_token(lookup_ident(literal), literal)
                 elif self.__is_digit(self.current_char):
                     tok = self.__read_number()
                     return tok
@@ -197,9 +241,19 @@ class Lexer:
         return tok
     
     def __read_string(self) -> str:
-        position: int = self.position + 1
+        """ Reads a string literal, decoding escape sequences as it goes """
+        chars: list[str] = []
         while True:
             self.__read_char()
             if self.current_char == '"' or self.current_char is None:
                 break
-        return self.source[position:self.position]
\ No newline at end of file
+
+            if self.current_char == '\\':
+                escaped: str | None = ESCAPE_SEQUENCES.get(self.__peek_char())
+                if escaped is not None:
+                    self.__read_char()
+                    chars.append(escaped)
+                    continue
+
+            chars.append(self.current_char)
+        return "".join(chars)
\ No newline at end of file
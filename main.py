@@ -5,34 +5,50 @@ A custom programming language compiler that lexes, parses, and compiles
 Forg source code to LLVM IR with JIT execution capabilities.
 
 Usage:
-    python main.py [options] [input_file]
+    python main.py [options] [input_file ...]
     
 Examples:
     python main.py tests/test3.forg
+    python main.py --quiet tests/test1.forg tests/test2.forg
     python main.py --debug-all tests/test1.forg
     python main.py --no-run --output program.exe tests/test2.forg
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import os
 import sys
 import time
-from ctypes import CFUNCTYPE, c_int
-from typing import Optional
-
-from llvmlite import ir
-import llvmlite.binding as llvm
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
 
 from lexer import Lexer 
 from parser import Parser
-from compiler import Compiler
 from AST import Program
 from config import CompilerConfig, OptimizationLevel
 from error_handler import error_handler, ErrorType
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command line arguments."""
+# llvmlite (native LLVM), ctypes and the compiler are imported where they are used,
+# so runs that stop after lexing or parsing never load them
+if TYPE_CHECKING:
+    import llvmlite.binding as llvm
+    from compiler import Compiler
+
+# LLVM process state, set up lazily and shared by every compile in this process
+_LLVM_READY: bool = False
+_DEFAULT_TRIPLE: Optional[str] = None
+_TARGET: Optional[llvm.Target] = None
+
+# Flags switched on by --debug-all
+DEBUG_ALL_FLAGS: tuple[str, ...] = ('debug_lexer', 'debug_parser', 'debug_compiler')
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once; later calls reuse it."""
     parser = argparse.ArgumentParser(
         description="Forg Language Compiler",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -42,12 +58,15 @@ Examples:
   %(prog)s --debug-all tests/test1.forg       # Enable all debug output
   %(prog)s --no-run -o program tests/test2.forg  # Compile only
   %(prog)s --benchmark tests/test4.forg       # Run with benchmarking
+  %(prog)s -q tests/test1.forg tests/test2.forg  # Batch: one RESULT line per file
         """
     )
     
     # Input/Output
-    parser.add_argument('input', nargs='?', default="tests/test3.forg",
-                       help='Input Forg source file (default: tests/test3.forg)')
+    parser.add_argument('inputs', nargs='*', metavar='input',
+                       help='Input Forg source file(s) (default: tests/test3.forg); with several, '
+                            'all are compiled in this process and a "RESULT <path> <status>" '
+                            'line is printed for each')
     parser.add_argument('-o', '--output', 
                        help='Output file name')
     
@@ -57,6 +76,8 @@ Examples:
                            help='Enable lexer debug output')
     debug_group.add_argument('--debug-parser', action='store_true',
                            help='Enable parser debug output (saves AST to debug/ast.json)')
+    debug_group.add_argument('--debug-parser-compact', action='store_true',
+                           help='Save the AST as compact, unindented JSON (implies --debug-parser)')
     debug_group.add_argument('--debug-compiler', action='store_true',
                            help='Enable compiler debug output (saves IR to debug/ir.ll)')
     debug_group.add_argument('--debug-all', action='store_true',
@@ -68,6 +89,9 @@ Examples:
                           help='Compile only, do not execute')
     exec_group.add_argument('--benchmark', action='store_true',
                           help='Enable benchmarking output')
+    exec_group.add_argument('--server', action='store_true',
+                          help='Serve compile requests: read one file path per line from stdin, '
+                               'answer each with its exit status on stdout')
     
     # Optimization
     parser.add_argument('-O', '--optimization', type=int, choices=[0, 1, 2, 3],
@@ -79,34 +103,86 @@ Examples:
     parser.add_argument('-q', '--quiet', action='store_true',
                        help='Quiet output (errors only)')
     
-    args = parser.parse_args()
+    return parser
+
+
+def parse_arguments(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments (sys.argv[1:] unless argv is given)."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    
+    if not args.inputs:
+        args.inputs = ["tests/test3.forg"]
+    if len(args.inputs) > 1 and args.output:
+        parser.error("-o/--output can't be used with more than one input file")
+    args.input = args.inputs[0]
     
     # Handle --debug-all flag
     if args.debug_all:
-        args.debug_lexer = True
+        for flag in DEBUG_ALL_FLAGS:
+            setattr(args, flag, True)
+    
+    if args.debug_parser_compact:
         args.debug_parser = True
-        args.debug_compiler = True
     
     return args
 
 
+def init_llvm() -> None:
+    """Initialize LLVM's native target and asm printer once per process."""
+    global _LLVM_READY
+    if not _LLVM_READY:
+        import llvmlite.binding as llvm
+
+        try:
+            llvm.initialize()
+        except RuntimeError:
+            pass  # Newer llvmlite initializes the core itself and rejects this call
+        llvm.initialize_native_target()
+        llvm.initialize_native_asmprinter()
+        _LLVM_READY = True
+
+
+def get_default_triple() -> str:
+    """Return the host target triple, queried from LLVM only once."""
+    global _DEFAULT_TRIPLE
+    if _DEFAULT_TRIPLE is None:
+        import llvmlite.binding as llvm
+
+        _DEFAULT_TRIPLE = llvm.get_default_triple()
+    return _DEFAULT_TRIPLE
+
+
+def get_target_machine() -> llvm.TargetMachine:
+    """
+    Return a new host target machine. The host target is looked up only once, but each
+    machine is owned (and freed) by the JIT engine it is given to, so it can't be shared.
+    """
+    global _TARGET
+    if _TARGET is None:
+        import llvmlite.binding as llvm
+
+        init_llvm()
+        _TARGET = llvm.Target.from_triple(get_default_triple())
+    return _TARGET.create_target_machine()
+
+
 def load_source_file(file_path: str) -> Optional[str]:
     """Load source code from file with error handling."""
     try:
-        if not os.path.exists(file_path):
-            error_handler.add_error(
-                ErrorType.INTERNAL,
-                f"Source file '{file_path}' not found",
-                0,
-                source_file=file_path,
-                suggestion="Check the file path and ensure the file exists"
-            )
-            return None
-            
-        with open(file_path, "r", encoding='utf-8') as f:
-            return f.read()
+        return Path(file_path).read_text(encoding='utf-8')
+
+    except FileNotFoundError:
+        error_handler.add_error(
+            ErrorType.INTERNAL,
+            f"Source file '{file_path}' not found",
+            0,
+            source_file=file_path,
+            suggestion="Check the file path and ensure the file exists"
+        )
+        return None
             
-    except IOError as e:
+    except OSError as e:
         error_handler.add_error(
             ErrorType.INTERNAL,
             f"Failed to read source file: {e}",
@@ -122,13 +198,15 @@ def run_lexer_debug(source: str, config: CompilerConfig) -> None:
         print("==== LEXER DEBUG ====")
         
     debug_lex = Lexer(source=source)
-    token_count = 0
     
-    while debug_lex.current_char is not None:
-        token = debug_lex.next_token()
-        if config.should_print("debug"):
-            print(f"  {token}")
-        token_count += 1
+    if config.should_print("debug"):
+        next_token = debug_lex.next_token
+        token_count = 0
+        while debug_lex.current_char is not None:
+            print(f"  {next_token()}")
+            token_count += 1
+    else:
+        token_count = len(debug_lex.tokenize_all())
         
     if config.should_print("info"):
         print(f"Lexer processed {token_count} tokens")
@@ -157,7 +235,10 @@ def run_parser(source: str, config: CompilerConfig) -> Optional[Program]:
         try:
             ast_path = config.get_ast_output_path()
             with open(ast_path, "w") as f:
-                json.dump(program.json(), f, indent=4)
+                if config.ast_compact:
+                    json.dump(program.json(), f, separators=(",", ":"))
+                else:
+                    json.dump(program.json(), f, indent=4)
             
             if config.should_print("info"):
                 print(f"AST saved to {ast_path}")
@@ -174,8 +255,10 @@ def run_parser(source: str, config: CompilerConfig) -> Optional[Program]:
     return program
 
 
-def run_compiler(program: Program, config: CompilerConfig) -> Optional[ir.Module]:
-    """Run compiler with error handling."""
+def run_compiler(program: Program, config: CompilerConfig) -> Optional[tuple[Compiler, str]]:
+    """Run compiler with error handling. Returns the compiler and its IR text."""
+    from compiler import Compiler
+
     compiler = Compiler()
     compiler.compile(node=program)
     
@@ -191,14 +274,15 @@ def run_compiler(program: Program, config: CompilerConfig) -> Optional[ir.Module
         return None
     
     module = compiler.module
-    module.triple = llvm.get_default_triple()
+    module.triple = get_default_triple()
+    ir_text = str(module)
     
     # Save IR debug output
     if config.compiler_debug:
         try:
             ir_path = config.get_ir_output_path()
             with open(ir_path, "w") as f:
-                f.write(str(module))
+                f.write(ir_text)
             
             if config.should_print("info"):
                 print(f"LLVM IR saved to {ir_path}")
@@ -212,27 +296,26 @@ def run_compiler(program: Program, config: CompilerConfig) -> Optional[ir.Module
     if config.should_print("info"):
         print("Compilation to LLVM IR successful")
     
-    return module
+    return compiler, ir_text
 
 
-def execute_program(module: ir.Module, config: CompilerConfig) -> Optional[int]:
+def execute_program(compiler: Compiler, ir_text: str, config: CompilerConfig) -> Optional[int]:
     """Execute the compiled program with JIT."""
     if not config.run_code:
         return None
+
+    from ctypes import CFUNCTYPE, c_int
+    import llvmlite.binding as llvm
         
     try:
         # Initialize LLVM
-        llvm.initialize()
-        llvm.initialize_native_target()
-        llvm.initialize_native_asmprinter()
+        init_llvm()
         
-        # Parse and verify IR
-        llvm_ir_parsed = llvm.parse_assembly(str(module))
-        llvm_ir_parsed.verify()
+        # Parse, verify and optimize the whole module once
+        llvm_ir_parsed = compiler.finalize(config.optimization_level.value, ir_text)
         
         # Create execution engine
-        target_machine = llvm.Target.from_default_triple().create_target_machine()
-        engine = llvm.create_mcjit_compiler(llvm_ir_parsed, target_machine)
+        engine = llvm.create_mcjit_compiler(llvm_ir_parsed, get_target_machine())
         engine.finalize_object()
         
         # Get main function
@@ -250,18 +333,18 @@ def execute_program(module: ir.Module, config: CompilerConfig) -> Optional[int]:
         efunc = CFUNCTYPE(c_int)(entry)
         
         # Execute with timing
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = efunc()
-        end_time = time.time()
+        end_ns = time.perf_counter_ns()
         
-        execution_time_ms = round((end_time - start_time) * 1000, 2)
+        execution_time_ms = (end_ns - start_ns) / 1_000_000
         
         if config.should_print("info"):
             print(f"\nProgram executed successfully")
             print(f"  Return value: {result}")
             
         if config.benchmark or config.should_print("debug"):
-            print(f"  Execution time: {execution_time_ms} ms")
+            print(f"  Execution time: {execution_time_ms:.2f} ms")
         
         return result
         
@@ -275,11 +358,8 @@ def execute_program(module: ir.Module, config: CompilerConfig) -> Optional[int]:
         return None
 
 
-def main() -> int:
-    """Main compiler entry point."""
-    args = parse_arguments()
-    config = CompilerConfig.from_args(args)
-    
+def run(config: CompilerConfig) -> int:
+    """Run the full pipeline on config.input_file and return its exit status."""
     if config.should_print("info"):
         print(f"Forg Language Compiler")
         print(f"Input: {config.input_file}")
@@ -301,13 +381,14 @@ def main() -> int:
         return 1
     
     # Compile to LLVM IR
-    module = run_compiler(program, config)
-    if module is None:
+    compiled = run_compiler(program, config)
+    if compiled is None:
         error_handler.print_summary()
         return 1
+    compiler, ir_text = compiled
     
     # Execute program
-    result = execute_program(module, config)
+    result = execute_program(compiler, ir_text, config)
     
     # Print summary
     error_handler.print_summary()
@@ -318,5 +399,72 @@ def main() -> int:
     return 0 if result is None else result
 
 
+def compile_file(path: str | Path, quiet: bool = True) -> int:
+    """
+    Compile and run a source file in this process, without the cost of starting
+    a new interpreter. Returns the same status as main(), before the OS truncates
+    it to an exit code.
+    """
+    error_handler.clear()
+    return run(CompilerConfig(input_file=str(path), quiet=quiet))
+
+
+def serve() -> int:
+    """
+    Compile server loop for --server: one path per stdin line, one status per stdout line.
+    
+    Program and compiler output is moved to stderr so it can't mix with the replies.
+    """
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), 'w', buffering=1)
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    
+    for line in sys.stdin:
+        path = line.strip()
+        if not path:
+            continue
+        
+        try:
+            status = compile_file(path)
+        except Exception as e:
+            print(f"Compile server error for {path}: {e}", file=sys.stderr)
+            status = 1
+        
+        sys.stdout.flush()
+        replies.write(f"{status}\n")
+    
+    return 0
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """
+    Compile and run every input in this process, sharing one interpreter and LLVM
+    initialization, and print a `RESULT <path> <status>` line after each.
+    
+    Returns 1 if any file failed to load, parse, compile or run, otherwise 0; a
+    program's own return value never counts as a failure.
+    """
+    failed = False
+    for path in args.inputs:
+        error_handler.clear()
+        config = CompilerConfig.from_args(args)
+        config.input_file = path
+        status = run(config)
+        failed = failed or error_handler.has_errors()
+        print(f"RESULT {path} {status}", flush=True)
+    
+    return 1 if failed else 0
+
+
+def main() -> int:
+    """Main compiler entry point."""
+    args = parse_arguments()
+    if args.server:
+        return serve()
+    if len(args.inputs) > 1:
+        return run_batch(args)
+    
+    return run(CompilerConfig.from_args(args))
+
+
 if __name__ == '__main__':
     sys.exit(main())
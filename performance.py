@@ -8,20 +8,54 @@ capabilities for the Forg language compiler.
 import time
 import sys
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
 from contextlib import contextmanager
+from pathlib import Path
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import hashlib
 import json
+import math
+import threading
 
 
-@dataclass
+# Conversions from the integer nanosecond timings to reporting units
+NS_PER_SECOND = 1_000_000_000
+NS_PER_MS = 1_000_000
+
+# PerformanceMetrics field updated when each named phase finishes
+PHASE_METRICS: Dict[str, str] = {
+    'lexing': 'lexing_ns',
+    'parsing': 'parsing_ns',
+    'compilation': 'compilation_ns',
+    'execution': 'execution_ns',
+}
+
+# Shared encoder for the newline-delimited benchmark results
+_RESULT_ENCODER = json.JSONEncoder()
+
+
+# Stand-ins bound in place of the profiler's recording methods while it is disabled
+@contextmanager
+def _time_phase_noop(phase_name: str):
+    yield
+
+
+def _record_noop(count: int):
+    pass
+
+
+def _memory_usage_noop() -> float:
+    return 0.0
+
+
+@dataclass(slots=True)
 class PerformanceMetrics:
-    """Container for performance metrics."""
-    lexing_time: float = 0.0
-    parsing_time: float = 0.0
-    compilation_time: float = 0.0
-    execution_time: float = 0.0
-    total_time: float = 0.0
+    """Container for performance metrics. Phase timings are integer nanoseconds."""
+    lexing_ns: int = 0
+    parsing_ns: int = 0
+    compilation_ns: int = 0
+    execution_ns: int = 0
     
     tokens_processed: int = 0
     ast_nodes_created: int = 0
@@ -30,28 +64,37 @@ class PerformanceMetrics:
     memory_usage_mb: float = 0.0
     peak_memory_mb: float = 0.0
     
-    def __post_init__(self):
-        """Calculate derived metrics."""
-        self.total_time = (self.lexing_time + self.parsing_time + 
-                          self.compilation_time + self.execution_time)
+    @property
+    def total_ns(self) -> int:
+        """Total of the individual phases, always in sync with them."""
+        return (self.lexing_ns + self.parsing_ns + 
+                self.compilation_ns + self.execution_ns)
     
     def tokens_per_second(self) -> float:
         """Calculate tokens processed per second."""
-        if self.lexing_time > 0:
-            return self.tokens_processed / self.lexing_time
+        if self.lexing_ns > 0:
+            return self.tokens_processed * NS_PER_SECOND / self.lexing_ns
         return 0.0
     
     def nodes_per_second(self) -> float:
         """Calculate AST nodes created per second."""
-        if self.parsing_time > 0:
-            return self.ast_nodes_created / self.parsing_time
+        if self.parsing_ns > 0:
+            return self.ast_nodes_created * NS_PER_SECOND / self.parsing_ns
         return 0.0
     
     def instructions_per_second(self) -> float:
         """Calculate IR instructions generated per second."""
-        if self.compilation_time > 0:
-            return self.ir_instructions_generated / self.compilation_time
+        if self.compilation_ns > 0:
+            return self.ir_instructions_generated * NS_PER_SECOND / self.compilation_ns
         return 0.0
+    
+    def throughput(self) -> Dict[str, float]:
+        """Calculate all throughput ratios at once, for reports that show them together."""
+        return {
+            'tokens_per_second': self.tokens_per_second(),
+            'nodes_per_second': self.nodes_per_second(),
+            'instructions_per_second': self.instructions_per_second()
+        }
 
 
 class PerformanceProfiler:
@@ -59,127 +102,159 @@ class PerformanceProfiler:
     Performance profiler for the Forg compiler.
     
     Provides timing, memory usage tracking, and performance analysis.
+    The recording methods are rebound to no-ops while profiling is disabled,
+    so callers on hot paths pay no enabled check.
     """
+    __slots__ = (
+        'metrics', 'phase_times', 'start_times', 'enabled', '_proc',
+        '_sample_counter', '_sample_mask',
+        # Rebound by enable()/disable()
+        'time_phase', 'record_tokens', 'record_ast_nodes',
+        'record_ir_instructions', 'get_memory_usage',
+    )
     
-    def __init__(self):
+    def __init__(self, sample_every: int = 64):
         self.metrics = PerformanceMetrics()
-        self.phase_times: Dict[str, float] = {}
-        self.start_times: Dict[str, float] = {}
-        self.enabled = False
+        self.phase_times: Dict[str, int] = {}
+        self.start_times: Dict[str, int] = {}
+        self._proc = None  # psutil.Process for this process, created on first enable
+        
+        # get_memory_usage reads RSS on every Nth call (N a power of two) and
+        # returns the last sample in between
+        self._sample_counter = 0
+        self._sample_mask = 0
+        self.set_sample_rate(sample_every)
+        
+        self.disable()
         
     def enable(self):
         """Enable performance profiling."""
         self.enabled = True
+        if self._proc is None:
+            try:
+                import psutil
+                self._proc = psutil.Process(os.getpid())
+            except ImportError:
+                # psutil not available, memory usage reads as 0
+                pass
+        self.time_phase = self._time_phase_impl
+        self.record_tokens = self._record_tokens_impl
+        self.record_ast_nodes = self._record_ast_nodes_impl
+        self.record_ir_instructions = self._record_ir_instructions_impl
+        self.get_memory_usage = self._get_memory_usage_impl
         
     def disable(self):
         """Disable performance profiling."""
         self.enabled = False
+        self.time_phase = _time_phase_noop
+        self.record_tokens = _record_noop
+        self.record_ast_nodes = _record_noop
+        self.record_ir_instructions = _record_noop
+        self.get_memory_usage = _memory_usage_noop
+    
+    def set_sample_rate(self, sample_every: int):
+        """Read RSS once every `sample_every` memory probes, rounded up to a power of two."""
+        sample_every = 1 << (max(sample_every, 1) - 1).bit_length()
+        self._sample_mask = sample_every - 1
     
     @contextmanager
-    def time_phase(self, phase_name: str):
+    def _time_phase_impl(self, phase_name: str):
         """Context manager for timing compilation phases."""
-        if not self.enabled:
-            yield
-            return
-            
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             yield
         finally:
-            end_time = time.time()
-            elapsed = end_time - start_time
-            self.phase_times[phase_name] = elapsed
+            self.phase_times[phase_name] = elapsed_ns = time.perf_counter_ns() - start_ns
             
             # Update metrics based on phase
-            if phase_name == "lexing":
-                self.metrics.lexing_time = elapsed
-            elif phase_name == "parsing":
-                self.metrics.parsing_time = elapsed
-            elif phase_name == "compilation":
-                self.metrics.compilation_time = elapsed
-            elif phase_name == "execution":
-                self.metrics.execution_time = elapsed
-    
-    def record_tokens(self, count: int):
+            field_name = PHASE_METRICS.get(phase_name)
+            if field_name is not None:
+                setattr(self.metrics, field_name, elapsed_ns)
+    
+    def _record_tokens_impl(self, count: int):
         """Record number of tokens processed."""
         self.metrics.tokens_processed = count
     
-    def record_ast_nodes(self, count: int):
+    def _record_ast_nodes_impl(self, count: int):
         """Record number of AST nodes created."""
         self.metrics.ast_nodes_created = count
     
-    def record_ir_instructions(self, count: int):
+    def _record_ir_instructions_impl(self, count: int):
         """Record number of IR instructions generated."""
         self.metrics.ir_instructions_generated = count
     
-    def get_memory_usage(self) -> float:
+    def _get_memory_usage_impl(self) -> float:
         """Get current memory usage in MB."""
-        try:
-            import psutil
-            process = psutil.Process(os.getpid())
-            memory_mb = process.memory_info().rss / 1024 / 1024
-            self.metrics.memory_usage_mb = memory_mb
-            if memory_mb > self.metrics.peak_memory_mb:
-                self.metrics.peak_memory_mb = memory_mb
-            return memory_mb
-        except ImportError:
-            # psutil not available, return 0
+        if self._proc is None:
             return 0.0
+        
+        counter = self._sample_counter
+        self._sample_counter = counter + 1
+        if counter & self._sample_mask:
+            return self.metrics.memory_usage_mb
+        
+        memory_mb = self._proc.memory_info().rss / 1024 / 1024
+        self.metrics.memory_usage_mb = memory_mb
+        self.metrics.peak_memory_mb = max(self.metrics.peak_memory_mb, memory_mb)
+        return memory_mb
     
     def print_summary(self, verbose: bool = False):
         """Print performance summary."""
         if not self.enabled:
             return
             
-        print("\n" + "="*50)
-        print("PERFORMANCE SUMMARY")
-        print("="*50)
+        # Build the whole report and write it in one call
+        lines: List[str] = [
+            "\n" + "="*50,
+            "PERFORMANCE SUMMARY",
+            "="*50,
+        ]
         
         # Timing breakdown
-        print(f"Lexing:      {self.metrics.lexing_time*1000:8.2f} ms")
-        print(f"Parsing:     {self.metrics.parsing_time*1000:8.2f} ms")
-        print(f"Compilation: {self.metrics.compilation_time*1000:8.2f} ms")
-        print(f"Execution:   {self.metrics.execution_time*1000:8.2f} ms")
-        print(f"Total:       {self.metrics.total_time*1000:8.2f} ms")
+        lines.append(f"Lexing:      {self.metrics.lexing_ns / NS_PER_MS:8.2f} ms")
+        lines.append(f"Parsing:     {self.metrics.parsing_ns / NS_PER_MS:8.2f} ms")
+        lines.append(f"Compilation: {self.metrics.compilation_ns / NS_PER_MS:8.2f} ms")
+        lines.append(f"Execution:   {self.metrics.execution_ns / NS_PER_MS:8.2f} ms")
+        lines.append(f"Total:       {self.metrics.total_ns / NS_PER_MS:8.2f} ms")
         
         # Throughput metrics
         if verbose:
-            print("\nThroughput:")
+            throughput = self.metrics.throughput()
+            lines.append("\nThroughput:")
             if self.metrics.tokens_processed > 0:
-                print(f"Tokens/sec:       {self.metrics.tokens_per_second():8.0f}")
+                lines.append(f"Tokens/sec:       {throughput['tokens_per_second']:8.0f}")
             if self.metrics.ast_nodes_created > 0:
-                print(f"AST nodes/sec:    {self.metrics.nodes_per_second():8.0f}")
+                lines.append(f"AST nodes/sec:    {throughput['nodes_per_second']:8.0f}")
             if self.metrics.ir_instructions_generated > 0:
-                print(f"IR instrs/sec:    {self.metrics.instructions_per_second():8.0f}")
+                lines.append(f"IR instrs/sec:    {throughput['instructions_per_second']:8.0f}")
         
         # Memory usage
         if self.metrics.memory_usage_mb > 0:
-            print(f"\nMemory Usage:")
-            print(f"Current:     {self.metrics.memory_usage_mb:8.2f} MB")
-            print(f"Peak:        {self.metrics.peak_memory_mb:8.2f} MB")
+            lines.append(f"\nMemory Usage:")
+            lines.append(f"Current:     {self.metrics.memory_usage_mb:8.2f} MB")
+            lines.append(f"Peak:        {self.metrics.peak_memory_mb:8.2f} MB")
         
-        print("="*50)
+        lines.append("="*50)
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def save_metrics(self, filename: str):
-        """Save metrics to JSON file."""
+    def save_metrics(self, filename: str, verbose: bool = False):
+        """Save metrics to JSON file, indented only when verbose."""
         if not self.enabled:
             return
             
         metrics_dict = {
             'timing': {
-                'lexing_ms': self.metrics.lexing_time * 1000,
-                'parsing_ms': self.metrics.parsing_time * 1000,
-                'compilation_ms': self.metrics.compilation_time * 1000,
-                'execution_ms': self.metrics.execution_time * 1000,
-                'total_ms': self.metrics.total_time * 1000
+                'lexing_ms': self.metrics.lexing_ns / NS_PER_MS,
+                'parsing_ms': self.metrics.parsing_ns / NS_PER_MS,
+                'compilation_ms': self.metrics.compilation_ns / NS_PER_MS,
+                'execution_ms': self.metrics.execution_ns / NS_PER_MS,
+                'total_ms': self.metrics.total_ns / NS_PER_MS
             },
             'throughput': {
                 'tokens_processed': self.metrics.tokens_processed,
                 'ast_nodes_created': self.metrics.ast_nodes_created,
                 'ir_instructions_generated': self.metrics.ir_instructions_generated,
-                'tokens_per_second': self.metrics.tokens_per_second(),
-                'nodes_per_second': self.metrics.nodes_per_second(),
-                'instructions_per_second': self.metrics.instructions_per_second()
+                **self.metrics.throughput()
             },
             'memory': {
                 'current_mb': self.metrics.memory_usage_mb,
@@ -188,8 +263,15 @@ class PerformanceProfiler:
         }
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(metrics_dict, f, indent=2)
+            import orjson
+            data = orjson.dumps(metrics_dict, option=orjson.OPT_INDENT_2 if verbose else 0)
+        except ImportError:
+            # orjson not available; json.dumps (unlike json.dump) can use the C encoder
+            data = json.dumps(metrics_dict, indent=2 if verbose else None).encode('utf-8')
+        
+        try:
+            with open(filename, 'wb') as f:
+                f.write(data)
         except IOError as e:
             print(f"Warning: Could not save metrics to {filename}: {e}")
 
@@ -201,6 +283,26 @@ class CompilerOptimizer:
     Provides various optimization techniques for the Forg compiler.
     """
     
+    # Module optimizers (see compiler.create_module_optimizer) keyed by opt_level,
+    # built on first use. The lock covers building and running, since a pass
+    # manager isn't safe to run from two threads at once.
+    _pm_cache: Dict[int, Any] = {}
+    _pm_lock = threading.Lock()
+    
+    # Single background worker for optimize_ir_async, created on first use
+    _opt_executor: Optional[ThreadPoolExecutor] = None
+    
+    @classmethod
+    def _get_pm(cls, opt_level: int):
+        """Return the cached module optimizer for this level; call with _pm_lock held."""
+        run_passes = cls._pm_cache.get(opt_level)
+        if run_passes is None:
+            from compiler import create_module_optimizer
+            
+            run_passes = create_module_optimizer(opt_level)
+            cls._pm_cache[opt_level] = run_passes
+        return run_passes
+    
     @staticmethod
     def optimize_ast(program):
         """
@@ -214,51 +316,137 @@ class CompilerOptimizer:
         # TODO: Implement AST optimizations
         return program
     
-    @staticmethod
-    def optimize_ir(module):
+    @classmethod
+    def optimize_ir(cls, module):
         """
         Apply LLVM IR-level optimizations.
         
         Uses LLVM's built-in optimization passes.
         """
         try:
-            import llvmlite.binding as llvm
-            
-            # Create pass manager
-            pmb = llvm.create_pass_manager_builder()
-            pmb.opt_level = 2  # -O2 optimization level
-            pmb.size_level = 0  # Don't optimize for size
-            
-            # Create module pass manager
-            pm = llvm.create_module_pass_manager()
-            pmb.populate(pm)
-            
-            # Run optimization passes
-            pm.run(module)
+            with cls._pm_lock:
+                # Run the -O2 optimization passes
+                cls._get_pm(2)(module)
             
             return module
         except Exception as e:
             print(f"Warning: IR optimization failed: {e}")
             return module
+    
+    @classmethod
+    def optimize_ir_async(cls, module) -> Future:
+        """
+        Run optimize_ir on a background thread.
+        
+        llvmlite releases the GIL while the passes run, so the caller can keep
+        reading or lexing the next file; join the returned future before
+        emitting code from the module.
+        """
+        with cls._pm_lock:
+            if cls._opt_executor is None:
+                cls._opt_executor = ThreadPoolExecutor(max_workers=1)
+        return cls._opt_executor.submit(cls.optimize_ir, module)
 
 
 # Global profiler instance
 profiler = PerformanceProfiler()
 
 
-def benchmark_file(file_path: str, iterations: int = 5) -> Dict[str, float]:
+# Parsed programs keyed by a BLAKE2b digest of their source bytes, for benchmark_file(reuse_ast=True)
+_PROGRAM_CACHE: Dict[bytes, Any] = {}
+
+
+def _cached_program(source_bytes: bytes, source: str):
+    """Return the parsed program for `source`, parsing only on a cache miss (None on parse errors)."""
+    key = hashlib.blake2b(source_bytes, digest_size=16).digest()
+    program = _PROGRAM_CACHE.get(key)
+    if program is None:
+        from lexer import Lexer
+        from parser import Parser
+        
+        parser = Parser(Lexer(source))
+        program = parser.parse_program()
+        if len(parser.errors) > 0:
+            return None
+        _PROGRAM_CACHE[key] = program
+    return program
+
+
+def _bench_once(source: str, program=None) -> Dict[str, Any]:
+    """
+    Run one lex/parse/compile iteration over `source`.
+    
+    Returns the phase timings in nanoseconds, the token count, and any
+    parser errors (compilation is skipped when parsing fails). When an
+    already parsed `program` is given, parsing is skipped and not timed.
+    """
+    # Import here to avoid circular imports
+    from lexer import Lexer
+    from parser import Parser
+    from compiler import Compiler
+    
+    result: Dict[str, Any] = {}
+    
+    # Time lexing
+    start = time.perf_counter_ns()
+    result['tokens'] = len(Lexer(source).tokenize_all())
+    result['lexing'] = time.perf_counter_ns() - start
+    
+    # Time parsing
+    if program is None:
+        start = time.perf_counter_ns()
+        lexer = Lexer(source)
+        parser = Parser(lexer)
+        program = parser.parse_program()
+        result['parsing'] = time.perf_counter_ns() - start
+        
+        result['errors'] = parser.errors
+        if len(parser.errors) > 0:
+            return result
+    else:
+        result['errors'] = []
+    
+    # Time compilation
+    start = time.perf_counter_ns()
+    compiler = Compiler()
+    compiler.compile(program)
+    result['compilation'] = time.perf_counter_ns() - start
+    
+    result['total'] = result['lexing'] + result.get('parsing', 0) + result['compilation']
+    return result
+
+
+def benchmark_file(file_path: Union[str, Path], iterations: int = 5, warmup: int = 1,
+                   reuse_ast: bool = False, parallel: bool = False) -> Dict[str, float]:
     """
     Benchmark compilation of a specific file.
     
+    Iterations run back to back in this process unless `parallel` is set.
+    Parallel iterations run concurrently in worker processes and contend for
+    CPU and memory bandwidth, so their timings are noisier and aren't
+    comparable with serial ones.
+    
     Args:
         file_path: Path to the Forg source file
         iterations: Number of iterations to run
+        warmup: Number of leading iterations left out of the statistics
+            (always keeping at least one); ignored with parallel
+        reuse_ast: Parse the source once (cached by content hash across calls)
+            and time only lexing and compilation; runs in this process
+        parallel: Run the iterations concurrently in worker processes, one
+            per CPU at most; ignored with reuse_ast
         
     Returns:
-        Dictionary with average timing results
+        Median time per phase in seconds, keyed by phase name, plus the
+        95th percentile under "<phase>_p95"
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Benchmark file not found: {file_path}")
+    # Read the source once so every iteration times the same work
+    try:
+        with open(file_path, 'rb') as f:
+            source_bytes = f.read()
+        source = source_bytes.decode('utf-8')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Benchmark file not found: {file_path}") from None
     
     print(f"Benchmarking {file_path} ({iterations} iterations)...")
     
@@ -269,116 +457,119 @@ def benchmark_file(file_path: str, iterations: int = 5) -> Dict[str, float]:
         'total': []
     }
     
-    for i in range(iterations):
-        # Import here to avoid circular imports
-        from lexer import Lexer
-        from parser import Parser
-        from compiler import Compiler
-        
-        # Read source
-        with open(file_path, 'r') as f:
-            source = f.read()
-        
-        # Time lexing
-        start = time.time()
-        lexer = Lexer(source)
-        tokens = []
-        while lexer.current_char is not None:
-            tokens.append(lexer.next_token())
-        lexing_time = time.time() - start
-        times['lexing'].append(lexing_time)
-        
-        # Time parsing
-        start = time.time()
-        lexer = Lexer(source)
-        parser = Parser(lexer)
-        program = parser.parse_program()
-        parsing_time = time.time() - start
-        times['parsing'].append(parsing_time)
-        
-        if len(parser.errors) > 0:
-            print(f"Parsing errors in iteration {i+1}: {parser.errors}")
-            continue
-        
-        # Time compilation
-        start = time.time()
-        compiler = Compiler()
-        compiler.compile(program)
-        compilation_time = time.time() - start
-        times['compilation'].append(compilation_time)
-        
-        total_time = lexing_time + parsing_time + compilation_time
-        times['total'].append(total_time)
+    program = _cached_program(source_bytes, source) if reuse_ast else None
     
-    # Calculate averages
-    averages = {}
+    if program is not None:
+        # The cached program lives in this process, so iterate here
+        results = [_bench_once(source, program) for _ in range(iterations)]
+    elif parallel and iterations > 1:
+        workers = min(iterations, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_bench_once, [source] * iterations))
+        # Every worker starts equally cold, so no result is a warmup run
+        warmup = 0
+    else:
+        results = [_bench_once(source) for _ in range(iterations)]
+    
+    for i, result in enumerate(results):
+        profiler.record_tokens(result['tokens'])
+        if len(result['errors']) > 0:
+            print(f"Parsing errors in iteration {i+1}: {result['errors']}")
+    
+    warmup = max(0, min(warmup, len(results) - 1))
+    for result in results[warmup:]:
+        for phase, phase_times in times.items():
+            if phase in result:
+                phase_times.append(result[phase])
+    
+    # Median and p95 per phase, converting nanoseconds to seconds once;
+    # unlike the mean, these aren't dragged around by cold-start outliers
+    stats = {}
     for phase, phase_times in times.items():
         if phase_times:
-            averages[phase] = sum(phase_times) / len(phase_times)
+            ordered = sorted(phase_times)
+            stats[phase] = ordered[(len(ordered) - 1) // 2] / NS_PER_SECOND
+            stats[f"{phase}_p95"] = ordered[math.ceil(0.95 * len(ordered)) - 1] / NS_PER_SECOND
         else:
-            averages[phase] = 0.0
+            stats[phase] = 0.0
+            stats[f"{phase}_p95"] = 0.0
     
     # Print results
-    print(f"Average times over {iterations} iterations:")
-    print(f"  Lexing:      {averages['lexing']*1000:6.2f} ms")
-    print(f"  Parsing:     {averages['parsing']*1000:6.2f} ms")
-    print(f"  Compilation: {averages['compilation']*1000:6.2f} ms")
-    print(f"  Total:       {averages['total']*1000:6.2f} ms")
+    print(f"Median (p95) times over {len(results) - warmup} of {iterations} iterations:")
+    print(f"  Lexing:      {stats['lexing']*1000:6.2f} ms ({stats['lexing_p95']*1000:6.2f} ms)")
+    print(f"  Parsing:     {stats['parsing']*1000:6.2f} ms ({stats['parsing_p95']*1000:6.2f} ms)")
+    print(f"  Compilation: {stats['compilation']*1000:6.2f} ms ({stats['compilation_p95']*1000:6.2f} ms)")
+    print(f"  Total:       {stats['total']*1000:6.2f} ms ({stats['total_p95']*1000:6.2f} ms)")
     
-    return averages
+    return stats
 
 
-def run_performance_suite():
-    """Run a comprehensive performance test suite."""
+def run_performance_suite(results_file: Optional[str] = os.path.join("output", "benchmark_results.jsonl")):
+    """
+    Run a comprehensive performance test suite.
+    
+    Each file's results are appended to `results_file` as one JSON line as
+    soon as it finishes, so long runs can be followed with `tail -f` and
+    earlier runs are kept for comparison. Pass None to skip writing results.
+    """
     print("Forg Compiler Performance Suite")
     print("="*40)
     
-    test_files = [
+    # Missing files are skipped when benchmark_file fails to open them
+    test_files = [Path(p) for p in (
         "tests/test1.forg",
         "tests/test2.forg", 
         "tests/test3.forg",
-        "tests/test4.forg"
-    ]
-    
-    # Add new test files if they exist
-    additional_tests = [
+        "tests/test4.forg",
         "tests/test_power.forg",
         "tests/test_factorial.forg",
         "tests/test_complex.forg"
-    ]
-    
-    for test_file in additional_tests:
-        if os.path.exists(test_file):
-            test_files.append(test_file)
+    )]
     
     results = {}
     
-    for test_file in test_files:
-        if os.path.exists(test_file):
+    results_out = None
+    if results_file is not None:
+        os.makedirs(os.path.dirname(results_file) or ".", exist_ok=True)
+        results_out = open(results_file, "a", encoding="utf-8")
+    
+    try:
+        for test_file in test_files:
             try:
                 results[test_file] = benchmark_file(test_file, iterations=3)
                 print()
+            except FileNotFoundError:
+                continue
             except Exception as e:
                 print(f"Error benchmarking {test_file}: {e}")
                 print()
+                continue
+            
+            if results_out is not None:
+                results_out.write(_RESULT_ENCODER.encode({'file': str(test_file), **results[test_file]}) + "\n")
+                results_out.flush()
+    finally:
+        if results_out is not None:
+            results_out.close()
     
     # Summary
     if results:
-        print("Performance Summary:")
-        print("-" * 40)
+        lines: List[str] = ["Performance Summary:", "-" * 40]
         total_avg = 0
         count = 0
         
         for file_path, timings in results.items():
-            filename = os.path.basename(file_path)
+            filename = file_path.name
             total_time = timings.get('total', 0) * 1000
-            print(f"{filename:20} {total_time:6.2f} ms")
+            lines.append(f"{filename:20} {total_time:6.2f} ms")
             total_avg += total_time
             count += 1
         
         if count > 0:
-            print("-" * 40)
-            print(f"{'Average:':20} {total_avg/count:6.2f} ms")
+            lines.append("-" * 40)
+            lines.append(f"{'Average:':20} {total_avg/count:6.2f} ms")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == '__main__':
@@ -5,23 +5,135 @@ This module provides comprehensive testing capabilities for the Forg compiler,
 including unit tests, integration tests, and performance benchmarks.
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
+import multiprocessing
 import os
+import pickle
+import platform
+import subprocess
 import sys
+import tempfile
+import threading
 import time
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional
 import json
-import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import llvmlite
 
+import custome_token as token_module
+import lexer as lexer_module
+import parser as parser_module
+import AST as ast_module
+import compiler as compiler_module
+import Envorment as environment_module
+import error_handler as error_handler_module
+import config as config_module
 from lexer import Lexer
 from parser import Parser
 from compiler import Compiler
+from config import CompilerConfig, OptimizationLevel
 from AST import Program
 from custome_token import TokenType
 from error_handler import ErrorHandler, ErrorType
 
 
+# On-disk cache of parsed programs and compile results, so repeated runs skip that work
+_TEST_CACHE_DIR = Path(".forg_test_cache")
+
+
+def _fingerprint(*modules, versions: tuple = ()) -> str:
+    """
+    Identify the current version of the given modules by hashing their source, so
+    cached entries survive checkouts and touches that change mtimes but not code.
+    Versions of external dependencies that affect the result go in `versions`.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for module in modules:
+        digest.update(Path(module.__file__).read_bytes())
+    for version in versions:
+        digest.update(f"\0{version}".encode())
+    return digest.hexdigest()
+
+
+# Every project module the lex/parse/compile pipeline imports, plus the interpreter
+# (pickle format) and llvmlite (IR output) versions; any change invalidates all entries
+_PIPELINE_FINGERPRINT = _fingerprint(
+    token_module, lexer_module, parser_module, ast_module, compiler_module,
+    environment_module, error_handler_module, config_module,
+    versions=(sys.version, llvmlite.__version__),
+)
+
+
+def _cache_key(kind: str, fingerprint: str, source: str) -> str:
+    return f"{kind}-" + hashlib.sha256(f"{fingerprint}\0{source}".encode()).hexdigest()
+
+
+def _cache_load(key: str) -> Optional[tuple]:
+    """Return the cached entry for key, or None on a miss."""
+    try:
+        with (_TEST_CACHE_DIR / key).open('rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def _cache_store(key: str, entry: tuple) -> None:
+    try:
+        _TEST_CACHE_DIR.mkdir(exist_ok=True)
+        with (_TEST_CACHE_DIR / key).open('wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def _cached_parse(source: str) -> tuple:
+    """
+    Parse source into a Program, reusing a pickled result when available.
+    
+    Returns (program, parser_errors).
+    """
+    key = _cache_key("ast", _PIPELINE_FINGERPRINT, source)
+    entry = _cache_load(key)
+    if entry is None:
+        parser = Parser(Lexer(source))
+        entry = (parser.parse_program(), parser.errors)
+        _cache_store(key, entry)
+    
+    return entry
+
+
+@lru_cache(maxsize=32)
+def _cached_compile(source: str) -> tuple:
+    """
+    Run source through the whole pipeline, reusing a pickled result when available
+    and an in-memory one on repeat calls within this process.
+    Compilation is skipped if parsing failed; exceptions propagate and are not cached.
+    
+    Returns (parser_errors, compiler_errors, ir_text).
+    """
+    key = _cache_key("ir", _PIPELINE_FINGERPRINT, source)
+    entry = _cache_load(key)
+    if entry is None:
+        program, parser_errors = _cached_parse(source)
+        if parser_errors:
+            entry = (parser_errors, [], None)
+        else:
+            compiler = Compiler()
+            compiler.compile(program)
+            entry = (parser_errors, compiler.errors, str(compiler.module))
+        _cache_store(key, entry)
+    
+    return entry
+
+
 @dataclass
 class TestCase:
     """Represents a single test case."""
@@ -37,69 +149,83 @@ class TestCase:
 class LexerTests(unittest.TestCase):
     """Unit tests for the lexer."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one lexer shared by every test."""
+        cls._lexer = Lexer("")
+    
+    def _lex(self, source: str) -> Lexer:
+        """Return the shared lexer, reset to source."""
+        self._lexer.reset(source)
+        return self._lexer
+    
     def test_basic_tokens(self):
         """Test basic token recognition."""
         source = "let x: int = 42;"
-        lexer = Lexer(source)
+        lexer = self._lex(source)
         
         expected_types = [
             TokenType.LET, TokenType.IDENT, TokenType.COLON, 
             TokenType.TYPE, TokenType.EQ, TokenType.INT, TokenType.SEMICOLON
         ]
         
-        for expected_type in expected_types:
-            token = lexer.next_token()
-            self.assertEqual(token.type, expected_type)
+        actual_types = [lexer.next_token().type for _ in expected_types]
+        self.assertEqual(actual_types, expected_types)
     
     def test_arithmetic_operators(self):
         """Test arithmetic operator tokens."""
         source = "+ - * / % ^"
-        lexer = Lexer(source)
+        lexer = self._lex(source)
         
         expected_types = [
             TokenType.PLUS, TokenType.MINUS, TokenType.ASTERISK,
             TokenType.SLASH, TokenType.MODULUS, TokenType.POW
         ]
         
-        for expected_type in expected_types:
-            token = lexer.next_token()
-            self.assertEqual(token.type, expected_type)
+        actual_types = [lexer.next_token().type for _ in expected_types]
+        self.assertEqual(actual_types, expected_types)
     
     def test_comparison_operators(self):
         """Test comparison operator tokens."""
         source = "< > <= >= == !="
-        lexer = Lexer(source)
+        lexer = self._lex(source)
         
         expected_types = [
             TokenType.LT, TokenType.GT, TokenType.LT_EQ,
             TokenType.GT_EQ, TokenType.EQ_EQ, TokenType.NOT_EQ
         ]
         
-        for expected_type in expected_types:
-            token = lexer.next_token()
-            self.assertEqual(token.type, expected_type)
+        actual_types = [lexer.next_token().type for _ in expected_types]
+        self.assertEqual(actual_types, expected_types)
     
     def test_numbers(self):
         """Test number literal recognition."""
         # Integer
-        lexer = Lexer("42")
+        lexer = self._lex("42")
         token = lexer.next_token()
         self.assertEqual(token.type, TokenType.INT)
         self.assertEqual(token.literal, 42)
         
         # Float
-        lexer = Lexer("3.14")
+        lexer = self._lex("3.14")
         token = lexer.next_token()
         self.assertEqual(token.type, TokenType.FLOAT)
         self.assertEqual(token.literal, 3.14)
     
     def test_strings(self):
         """Test string literal recognition."""
-        lexer = Lexer('"Hello, World!"')
+        lexer = self._lex('"Hello, World!"')
         token = lexer.next_token()
         self.assertEqual(token.type, TokenType.STRING)
         self.assertEqual(token.literal, "Hello, World!")
     
+    def test_string_escapes(self):
+        """Test escape sequences are decoded in string literals."""
+        lexer = self._lex(r'"a\tb\n\"c\"\\"')
+        token = lexer.next_token()
+        self.assertEqual(token.type, TokenType.STRING)
+        self.assertEqual(token.literal, 'a\tb\n"c"\\')
+    
     def test_keywords(self):
         """Test keyword recognition."""
         keywords = {
@@ -116,10 +242,50 @@ class LexerTests(unittest.TestCase):
             "false": TokenType.FALSE
         }
         
-        for keyword, expected_type in keywords.items():
-            lexer = Lexer(keyword)
-            token = lexer.next_token()
-            self.assertEqual(token.type, expected_type)
+        actual_types = [self._lex(keyword).next_token().type for keyword in keywords]
+        self.assertEqual(actual_types, list(keywords.values()))
+    
+    def test_tokenize_all(self):
+        """Test bulk tokenization matches the next_token loop."""
+        source = "let x: int = 42;"
+        
+        expected = []
+        lexer = self._lex(source)
+        while lexer.current_char is not None:
+            expected.append(lexer.next_token().type)
+        
+        tokens = self._lex(source).tokenize_all()
+        self.assertEqual([token.type for token in tokens], expected)
+    
+    def test_symbol_alt_keywords(self):
+        """Test alt keywords that aren't identifier-shaped."""
+        source = "bruh main() 3--D int"
+        lexer = self._lex(source)
+        
+        expected_types = [
+            TokenType.FN, TokenType.IDENT, TokenType.LPAREN,
+            TokenType.RPAREN, TokenType.ARROW, TokenType.TYPE
+        ]
+        
+        actual_types = [lexer.next_token().type for _ in expected_types]
+        self.assertEqual(actual_types, expected_types)
+        
+        # A plain number sharing the first char still lexes as a number
+        token = self._lex("3 - 1").next_token()
+        self.assertEqual(token.type, TokenType.INT)
+    
+    def test_reset(self):
+        """Test a reset lexer starts over like a fresh one."""
+        lexer = Lexer("let x: int = 1;\nx = 2;")
+        lexer.tokenize_all()
+        
+        source = "fn main() -> int { return 0; }"
+        lexer.reset(source)
+        self.assertEqual(lexer.line_no, 1)
+        self.assertEqual(
+            [(token.type, token.literal) for token in lexer.tokenize_all()],
+            [(token.type, token.literal) for token in Lexer(source).tokenize_all()],
+        )
 
 
 class ParserTests(unittest.TestCase):
@@ -216,121 +382,119 @@ class ParserTests(unittest.TestCase):
         self.assertEqual(stmt.type().value, "ForStatement")
 
 
+# Integration test programs, built once at import time
+_INTEGRATION_CASES = (
+    TestCase(
+        name="simple_arithmetic",
+        source_code="""
+        fn main() -> int {
+            let x: int = 5;
+            let y: int = 10;
+            return x + y;
+        }
+        """,
+        expected_result=15,
+        description="Test basic arithmetic operations"
+    ),
+    TestCase(
+        name="conditional_logic",
+        source_code="""
+        fn main() -> int {
+            let x: int = 5;
+            if x < 10 {
+                return 1;
+            } else {
+                return 0;
+            }
+        }
+        """,
+        expected_result=1,
+        description="Test conditional logic"
+    ),
+    TestCase(
+        name="function_call",
+        source_code="""
+        fn add(a: int, b: int) -> int {
+            return a + b;
+        }
+        
+        fn main() -> int {
+            return add(5, 10);
+        }
+        """,
+        expected_result=15,
+        description="Test function calls"
+    ),
+    TestCase(
+        name="while_loop",
+        source_code="""
+        fn main() -> int {
+            let i: int = 0;
+            let sum: int = 0;
+            while i < 5 {
+                sum = sum + i;
+                i = i + 1;
+            }
+            return sum;
+        }
+        """,
+        expected_result=10,  # 0+1+2+3+4 = 10
+        description="Test while loops"
+    ),
+    TestCase(
+        name="for_loop_with_break",
+        source_code="""
+        fn main() -> int {
+            let sum: int = 0;
+            for (let i: int = 0; i < 10; i = i + 1) {
+                if i == 5 {
+                    break;
+                }
+                sum = sum + i;
+            }
+            return sum;
+        }
+        """,
+        expected_result=10,  # 0+1+2+3+4 = 10
+        description="Test for loops with break"
+    ),
+    TestCase(
+        name="integer_power",
+        source_code="""
+        fn main() -> int {
+            let base: int = 3;
+            let exponent: int = 4;
+            return base ^ exponent;
+        }
+        """,
+        expected_result=81,
+        description="Test integer exponentiation"
+    ),
+)
+
+
 class IntegrationTests(unittest.TestCase):
     """Integration tests for the complete compiler pipeline."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.test_cases = [
-            TestCase(
-                name="simple_arithmetic",
-                source_code="""
-                fn main() -> int {
-                    let x: int = 5;
-                    let y: int = 10;
-                    return x + y;
-                }
-                """,
-                expected_result=15,
-                description="Test basic arithmetic operations"
-            ),
-            TestCase(
-                name="conditional_logic",
-                source_code="""
-                fn main() -> int {
-                    let x: int = 5;
-                    if x < 10 {
-                        return 1;
-                    } else {
-                        return 0;
-                    }
-                }
-                """,
-                expected_result=1,
-                description="Test conditional logic"
-            ),
-            TestCase(
-                name="function_call",
-                source_code="""
-                fn add(a: int, b: int) -> int {
-                    return a + b;
-                }
-                
-                fn main() -> int {
-                    return add(5, 10);
-                }
-                """,
-                expected_result=15,
-                description="Test function calls"
-            ),
-            TestCase(
-                name="while_loop",
-                source_code="""
-                fn main() -> int {
-                    let i: int = 0;
-                    let sum: int = 0;
-                    while i < 5 {
-                        sum = sum + i;
-                        i = i + 1;
-                    }
-                    return sum;
-                }
-                """,
-                expected_result=10,  # 0+1+2+3+4 = 10
-                description="Test while loops"
-            ),
-            TestCase(
-                name="for_loop_with_break",
-                source_code="""
-                fn main() -> int {
-                    let sum: int = 0;
-                    for (let i: int = 0; i < 10; i = i + 1) {
-                        if i == 5 {
-                            break;
-                        }
-                        sum = sum + i;
-                    }
-                    return sum;
-                }
-                """,
-                expected_result=10,  # 0+1+2+3+4 = 10
-                description="Test for loops with break"
-            )
-        ]
-    
-    def test_compilation_pipeline(self):
-        """Test the complete compilation pipeline for each test case."""
-        for test_case in self.test_cases:
-            with self.subTest(test_case=test_case.name):
-                self._run_test_case(test_case)
-    
     def _run_test_case(self, test_case: TestCase):
         """Run a single test case through the compilation pipeline."""
         error_handler = ErrorHandler()
         
         try:
-            # Lexing
-            lexer = Lexer(test_case.source_code)
-            
-            # Parsing
-            parser = Parser(lexer)
-            program = parser.parse_program()
+            # Lexing, parsing and compilation (cached by source hash)
+            parser_errors, compiler_errors, _ = _cached_compile(test_case.source_code)
             
-            if len(parser.errors) > 0:
+            if len(parser_errors) > 0:
                 if test_case.should_fail:
                     return  # Expected failure
                 else:
-                    self.fail(f"Parser errors: {parser.errors}")
-            
-            # Compilation
-            compiler = Compiler()
-            compiler.compile(program)
+                    self.fail(f"Parser errors: {parser_errors}")
             
-            if len(compiler.errors) > 0:
+            if len(compiler_errors) > 0:
                 if test_case.should_fail:
                     return  # Expected failure
                 else:
-                    self.fail(f"Compiler errors: {compiler.errors}")
+                    self.fail(f"Compiler errors: {compiler_errors}")
             
             # If we expect this test to fail but it didn't, that's an error
             if test_case.should_fail:
@@ -349,28 +513,133 @@ class IntegrationTests(unittest.TestCase):
                 self.fail(f"Unexpected exception in test case '{test_case.name}': {e}")
 
 
+def _make_integration_test(test_case: TestCase):
+    """Build a test method that runs test_case through the compilation pipeline."""
+    def test(self):
+        self._run_test_case(test_case)
+    
+    test.__name__ = f"test_{test_case.name}"
+    test.__doc__ = test_case.description
+    return test
+
+
+# One test method per case, so each is collected, reported and distributable on its own
+for _test_case in _INTEGRATION_CASES:
+    setattr(IntegrationTests, f"test_{_test_case.name}", _make_integration_test(_test_case))
+del _test_case
+
+
+def _execute_source(source: str, opt_level: int = 0) -> Optional[int]:
+    """Compile source and run its main() through the JIT, as main.py does."""
+    from main import run_compiler, execute_program
+    
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    if parser.errors:
+        return None
+    
+    config = CompilerConfig(quiet=True, optimization_level=OptimizationLevel(opt_level))
+    compiled = run_compiler(program, config)
+    if compiled is None:
+        return None
+    
+    return execute_program(*compiled, config)
+
+
+def _int_source(value: int) -> str:
+    """Spell an int in Forg, which has no unary minus."""
+    return str(value) if value >= 0 else f"0 - {-value}"
+
+
+class ExecutionTests(unittest.TestCase):
+    """End-to-end tests that JIT-compile and run programs."""
+    
+    def test_integer_power(self):
+        """Test '^' results, including negative exponents truncated toward zero."""
+        cases = {
+            (3, 4): 81, (-2, 3): -8, (3, 0): 1,
+            (2, -1): 0, (0, -1): 0, (1, -3): 1, (-1, -3): -1, (-1, -2): 1,
+        }
+        
+        for (base, exponent), expected in cases.items():
+            with self.subTest(base=base, exponent=exponent):
+                source = f"""
+                fn main() -> int {{
+                    let b: int = {_int_source(base)};
+                    let e: int = {_int_source(exponent)};
+                    return b ^ e;
+                }}
+                """
+                self.assertEqual(_execute_source(source), expected)
+    
+    def test_optimization_levels(self):
+        """Test a program runs and returns the same value at every -O level."""
+        source = """
+        fn add(a: int, b: int) -> int {
+            return a + b;
+        }
+        
+        fn main() -> int {
+            let i: int = 0;
+            let sum: int = 0;
+            while i < 5 {
+                sum = add(sum, i ^ 2);
+                i = i + 1;
+            }
+            return sum;
+        }
+        """
+        
+        for opt_level in (0, 1, 2, 3):
+            with self.subTest(opt_level=opt_level):
+                self.assertEqual(_execute_source(source, opt_level), 30)  # 0+1+4+9+16
+    
+    def test_batch_exit_status(self):
+        """Test main.py's multi-file mode fails only on compiler/load errors."""
+        from main import parse_arguments, run_batch
+        
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            # test2 returns 420, a program result rather than a failure
+            ok_status = run_batch(parse_arguments(['-q', 'tests/test1.forg', 'tests/test2.forg']))
+            missing_status = run_batch(parse_arguments(['-q', 'tests/missing.forg', 'tests/test1.forg']))
+        
+        self.assertEqual(ok_status, 0)
+        self.assertEqual(missing_status, 1)
+        self.assertIn("RESULT tests/test2.forg 420", output.getvalue())
+
+
+# The timing thresholds are calibrated for interpreted CPython; PyPy (JIT warmup) and
+# Nuitka builds (sets __compiled__) have different cost profiles
+_TIMING_THRESHOLDS_APPLY = (
+    platform.python_implementation() == "CPython" and "__compiled__" not in globals()
+)
+_TIMING_SKIP_REASON = "timing thresholds are calibrated for interpreted CPython only"
+
+# Performance test inputs, built once at import time; --parallel workers inherit them
+# rather than receiving a copy per task
+_LEXER_BENCH_SOURCE = "\n".join("let var%d: int = %d;" % (i, i) for i in range(1000))
+_PARSER_BENCH_SOURCE = "fn main() -> int {\n%s\n    return 0;\n}" % "\n".join(
+    "    let var%d: int = %d;" % (i, i) for i in range(100)
+)
+
+
 class PerformanceTests(unittest.TestCase):
     """Performance and benchmark tests."""
     
     def test_lexer_performance(self):
         """Test lexer performance on large input."""
-        # Generate a large source file
-        source_lines = []
-        for i in range(1000):
-            source_lines.append(f"let var{i}: int = {i};")
-        source = "\n".join(source_lines)
-        
         start_time = time.time()
-        lexer = Lexer(source)
+        lexer = Lexer(_LEXER_BENCH_SOURCE)
         
-        token_count = 0
-        while lexer.current_char is not None:
-            lexer.next_token()
-            token_count += 1
+        # Batched call so the timing measures the lexer, not a Python driver loop
+        token_count = len(lexer.tokenize_all())
         
         end_time = time.time()
         elapsed_time = end_time - start_time
         
+        if not _TIMING_THRESHOLDS_APPLY:
+            self.skipTest(_TIMING_SKIP_REASON)
+        
         # Should process at least 1000 tokens per second
         tokens_per_second = token_count / elapsed_time
         self.assertGreater(tokens_per_second, 1000, 
@@ -378,26 +647,132 @@ class PerformanceTests(unittest.TestCase):
     
     def test_parser_performance(self):
         """Test parser performance on large input."""
-        # Generate a large source file with function declarations
-        source_lines = ["fn main() -> int {"]
-        for i in range(100):
-            source_lines.append(f"    let var{i}: int = {i};")
-        source_lines.append("    return 0;")
-        source_lines.append("}")
-        source = "\n".join(source_lines)
-        
         start_time = time.time()
-        lexer = Lexer(source)
+        lexer = Lexer(_PARSER_BENCH_SOURCE)
         parser = Parser(lexer)
         program = parser.parse_program()
         end_time = time.time()
         
         elapsed_time = end_time - start_time
         
+        self.assertEqual(len(parser.errors), 0)
+        
+        if not _TIMING_THRESHOLDS_APPLY:
+            self.skipTest(_TIMING_SKIP_REASON)
+        
         # Should parse quickly
         self.assertLess(elapsed_time, 1.0, 
                        f"Parser too slow: {elapsed_time:.3f} seconds")
-        self.assertEqual(len(parser.errors), 0)
+
+
+def _silence_stdout() -> None:
+    """Pool initializer: discard worker stdout, including output from JIT-compiled code."""
+    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+
+def _compile_to_scratch(path: str, expected: int) -> tuple:
+    """
+    Pool task: compile path with stdout sent to a scratch file rather than a pipe, reading
+    it back only when the status doesn't match expected.
+    
+    Returns (status, output), where output is empty on a match.
+    """
+    from main import compile_file
+    
+    with tempfile.TemporaryFile() as scratch:
+        saved_stdout = os.dup(sys.stdout.fileno())
+        os.dup2(scratch.fileno(), sys.stdout.fileno())
+        try:
+            status = compile_file(path)
+            sys.stdout.flush()
+        finally:
+            os.dup2(saved_stdout, sys.stdout.fileno())
+            os.close(saved_stdout)
+        
+        if status == expected:
+            return status, ""
+        
+        scratch.seek(0)
+        return status, scratch.read().decode('utf-8', errors='replace').strip()
+
+
+def _compile_in_pool(test_files: List[tuple]) -> Dict[str, Any]:
+    """
+    Compile each file in a worker forked from this already-warm interpreter (compiler
+    and llvmlite are imported). Each file gets a fresh worker to isolate LLVM and error state.
+    
+    Returns each file's (status, output), or the exception raised while waiting for it.
+    """
+    outcomes: Dict[str, Any] = {}
+    context = multiprocessing.get_context("fork")
+    with context.Pool(processes=min(len(test_files), os.cpu_count() or 1),
+                      initializer=_silence_stdout, maxtasksperchild=1) as pool:
+        pending = {path: pool.apply_async(_compile_to_scratch, (path, expected))
+                   for path, expected in test_files}
+        
+        for path, result in pending.items():
+            try:
+                outcomes[path] = result.get(timeout=10)
+            except multiprocessing.TimeoutError:
+                outcomes[path] = TimeoutError()
+            except Exception as e:
+                outcomes[path] = e
+    
+    return outcomes
+
+
+def _fork_is_default() -> bool:
+    """
+    Whether forking this process is safe. Only Linux keeps fork as its default start
+    method; macOS offers it but defaults to spawn because forking after LLVM and the
+    system frameworks have started threads can deadlock or crash the child.
+    """
+    return (sys.platform.startswith("linux")
+            and multiprocessing.get_start_method(allow_none=True) in (None, "fork"))
+
+
+def _compile_with_server(test_files: List[tuple]) -> Dict[str, Any]:
+    """
+    Compile each file through one long-lived `main.py --server` process, for platforms
+    where forking isn't the default. The server is restarted only if a request times out or kills it.
+    
+    Returns each file's (status, output), or the exception describing why it has none.
+    The server's output is discarded, so output is always empty.
+    """
+    outcomes: Dict[str, Any] = {}
+    server = None
+    
+    for path, _ in test_files:
+        if server is None or server.poll() is not None:
+            server = subprocess.Popen([sys.executable, "main.py", "--server"],
+                                      stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL, text=True)
+        
+        watchdog = threading.Timer(10, server.kill)
+        watchdog.start()
+        try:
+            server.stdin.write(f"{path}\n")
+            server.stdin.flush()
+            reply = server.stdout.readline()
+        except OSError as e:
+            reply = ""
+            outcomes[path] = e
+        finally:
+            timed_out = not watchdog.is_alive()
+            watchdog.cancel()
+        
+        if reply:
+            outcomes[path] = (int(reply), "")
+        elif timed_out:
+            outcomes[path] = TimeoutError()
+        else:
+            outcomes.setdefault(path, RuntimeError("compile server exited"))
+    
+    if server is not None and server.poll() is None:
+        server.stdin.close()
+        server.wait(timeout=10)
+    
+    return outcomes
 
 
 def run_file_tests():
@@ -411,74 +786,136 @@ def run_file_tests():
     
     print("\n=== File-based Integration Tests ===")
     
+    existing = [(file_path, expected) for file_path, expected in test_files
+                if os.path.exists(file_path)]
+    if not existing:
+        outcomes = {}
+    elif _fork_is_default():
+        outcomes = _compile_in_pool(existing)
+    else:
+        outcomes = _compile_with_server(existing)
+    
+    # Report in list order
     for file_path, expected_result in test_files:
-        if not os.path.exists(file_path):
+        if file_path not in outcomes:
             print(f"⚠️  Test file not found: {file_path}")
             continue
             
         print(f"\nTesting {file_path}...")
         
-        try:
-            # Run the compiler on the test file
-            result = subprocess.run([
-                sys.executable, "main.py", "--quiet", file_path
-            ], capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == expected_result:
-                print(f"✅ {file_path}: PASSED (returned {result.returncode})")
+        outcome = outcomes[file_path]
+        if isinstance(outcome, TimeoutError):
+            print(f"❌ {file_path}: TIMEOUT")
+        elif isinstance(outcome, Exception):
+            print(f"❌ {file_path}: ERROR - {outcome}")
+        else:
+            status, output = outcome
+            if status == expected_result:
+                print(f"✅ {file_path}: PASSED (returned {status})")
             else:
                 print(f"❌ {file_path}: FAILED")
                 print(f"   Expected: {expected_result}")
-                print(f"   Got: {result.returncode}")
-                if result.stderr:
-                    print(f"   Error: {result.stderr.strip()}")
-                    
-        except subprocess.TimeoutExpired:
-            print(f"❌ {file_path}: TIMEOUT")
-        except Exception as e:
-            print(f"❌ {file_path}: ERROR - {e}")
+                print(f"   Got: {status}")
+                if output:
+                    print(f"   Output: {output}")
+
+
+# Unit test classes run by main(), in report order
+TEST_CLASSES = (LexerTests, ParserTests, IntegrationTests, ExecutionTests, PerformanceTests)
 
 
-def main():
+def _load_test_suite(test_classes) -> unittest.TestSuite:
+    """
+    Build the suite for test_classes, reusing the test method names found on an earlier
+    run while this file is unchanged instead of introspecting every class again.
+    """
+    key = _cache_key("suite", _fingerprint(sys.modules[__name__]),
+                     ",".join(test_class.__name__ for test_class in test_classes))
+    names = _cache_load(key)
+    if names is None:
+        loader = unittest.TestLoader()
+        names = tuple((test_class.__name__, tuple(loader.getTestCaseNames(test_class)))
+                      for test_class in test_classes)
+        _cache_store(key, names)
+    
+    by_name = {test_class.__name__: test_class for test_class in test_classes}
+    return unittest.TestSuite(
+        by_name[class_name](method_name)
+        for class_name, method_names in names
+        for method_name in method_names
+    )
+
+
+def _run_test_class(test_class) -> tuple:
+    """
+    Run one TestCase class in a worker process.
+    
+    Returns the runner's output plus picklable (name, traceback) pairs,
+    since TestResult objects can't cross the process boundary.
+    """
+    stream = io.StringIO()
+    suite = _load_test_suite((test_class,))
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    
+    return (
+        stream.getvalue(),
+        result.testsRun,
+        [(str(test), traceback) for test, traceback in result.failures],
+        [(str(test), traceback) for test, traceback in result.errors],
+    )
+
+
+def main(argv: Optional[List[str]] = None):
     """Run all tests."""
+    arg_parser = argparse.ArgumentParser(description="Forg Compiler Test Suite")
+    arg_parser.add_argument('--parallel', type=int, default=1, metavar='N',
+                            help='Run the unit test classes in N worker processes (default: 1, sequential)')
+    args = arg_parser.parse_args(argv)
+    
     print("Forg Compiler Test Suite")
     print("=" * 40)
     
     # Run unit tests
     print("\n=== Unit Tests ===")
-    test_loader = unittest.TestLoader()
-    test_suite = unittest.TestSuite()
-    
-    # Add test classes
-    test_suite.addTests(test_loader.loadTestsFromTestCase(LexerTests))
-    test_suite.addTests(test_loader.loadTestsFromTestCase(ParserTests))
-    test_suite.addTests(test_loader.loadTestsFromTestCase(IntegrationTests))
-    test_suite.addTests(test_loader.loadTestsFromTestCase(PerformanceTests))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
+    if args.parallel > 1:
+        # Each TestCase class builds its own lexer/parser/compiler, so classes are independent
+        tests_run = 0
+        failures: List[tuple] = []
+        errors: List[tuple] = []
+        with ProcessPoolExecutor(max_workers=min(args.parallel, len(TEST_CLASSES))) as pool:
+            for output, run, class_failures, class_errors in pool.map(_run_test_class, TEST_CLASSES):
+                sys.stderr.write(output)
+                tests_run += run
+                failures.extend(class_failures)
+                errors.extend(class_errors)
+    else:
+        # Run tests
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(_load_test_suite(TEST_CLASSES))
+        tests_run = result.testsRun
+        failures = result.failures
+        errors = result.errors
     
     # Run file-based tests
     run_file_tests()
     
     # Print summary
     print(f"\n=== Test Summary ===")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
+    print(f"Tests run: {tests_run}")
+    print(f"Failures: {len(failures)}")
+    print(f"Errors: {len(errors)}")
     
-    if result.failures:
+    if failures:
         print("\nFailures:")
-        for test, traceback in result.failures:
+        for test, traceback in failures:
             print(f"  - {test}: {traceback.split('AssertionError: ')[-1].split('\\n')[0]}")
     
-    if result.errors:
+    if errors:
         print("\nErrors:")
-        for test, traceback in result.errors:
+        for test, traceback in errors:
             print(f"  - {test}: {traceback.split('\\n')[-2]}")
     
-    success = len(result.failures) == 0 and len(result.errors) == 0
+    success = len(failures) == 0 and len(errors) == 0
     print(f"\n{'✅ All tests passed!' if success else '❌ Some tests failed.'}")
     
     return 0 if success else 1